@@ -1,11 +1,14 @@
 package main
 
 import (
+	"bytes"
 	"encoding/json"
 	"flag"
 	"fmt"
+	"io"
 	"os"
 	"strings"
+	"sync"
 
 	"palo-pan-parsing/models"
 	"palo-pan-parsing/processor"
@@ -23,6 +26,7 @@ func main() {
 		configFile    = flag.String("c", "", "Path to configuration file")
 		deviceGroup   = flag.String("dg", "", "Device group to scan for duplicate address objects")
 		verbose       = flag.Bool("verbose", false, "Run in verbose interactive mode (classic)")
+		cache         = flag.Bool("cache", false, "Reuse and store scan results in the user cache directory (palo-pan-parsing)")
 		help          = flag.Bool("h", false, "Show help")
 	)
 
@@ -50,7 +54,7 @@ func main() {
 	} else if *verbose {
 		runInteractiveMode()
 	} else if *addressFlag != "" || *configFile != "" {
-		runCommandLineMode(*addressFlag, *logfile, *outputFlag, *configFile)
+		runCommandLineMode(*addressFlag, *logfile, *outputFlag, *configFile, *cache)
 	} else {
 		// Default to TUI mode when no specific arguments provided
 		runTUIMode()
@@ -91,14 +95,27 @@ func runInteractiveMode() {
 	})
 }
 
-func runCommandLineMode(addressFlag, logfile, outputFlag, configFile string) {
+// readConfigFile reads a JSON configuration file in one read and decodes it
+func readConfigFile(configFile string) (map[string]interface{}, error) {
+	data, err := os.ReadFile(configFile)
+	if err != nil {
+		return nil, err
+	}
+
+	var config map[string]interface{}
+	if err := json.Unmarshal(data, &config); err != nil {
+		return nil, fmt.Errorf("invalid JSON in %s: %w", configFile, err)
+	}
+	return config, nil
+}
+
+func runCommandLineMode(addressFlag, logfile, outputFlag, configFile string, cacheResults bool) {
 	var config map[string]interface{}
 
 	// Read config file if provided
 	if configFile != "" {
-		if data, err := os.ReadFile(configFile); err == nil {
-			json.Unmarshal(data, &config)
-		} else {
+		var err error
+		if config, err = readConfigFile(configFile); err != nil {
 			fmt.Printf(ui.ColorError("Error reading config file: %v\n"), err)
 			return
 		}
@@ -132,6 +149,8 @@ func runCommandLineMode(addressFlag, logfile, outputFlag, configFile string) {
 		addressInput := ui.PromptInput("Enter the address name (comma-separated for multiple)", "")
 		addresses = utils.ParseAddressList(addressInput)
 	}
+	// Repeated addresses would have two report writers racing on the same file
+	addresses = utils.UniqueAddresses(addresses)
 
 	if len(addresses) == 0 {
 		fmt.Println(ui.ColorError("No addresses specified"))
@@ -143,6 +162,7 @@ func runCommandLineMode(addressFlag, logfile, outputFlag, configFile string) {
 
 	// Process file
 	processor := processor.NewPANLogProcessor()
+	processor.CacheResults = cacheResults
 	if err := processor.ProcessFileSinglePass(logfile, addresses); err != nil {
 		fmt.Printf(ui.ColorError("Error processing file: %v\n"), err)
 		return
@@ -156,21 +176,54 @@ func runCommandLineMode(addressFlag, logfile, outputFlag, configFile string) {
 		}
 		ProcessAddress(addresses[0], processor, false, outputFile, logfile)
 	} else {
-		for _, address := range addresses {
-			ProcessAddress(address, processor, false, "", logfile)
+		// Reports only read the finished scan results, so they are written
+		// concurrently and each address's messages are printed in order afterwards
+		outputs := make([]bytes.Buffer, len(addresses))
+		writers := make(chan struct{}, min(utils.MaxReportWriters, len(addresses)))
+		var wg sync.WaitGroup
+		for i, address := range addresses {
+			wg.Add(1)
+			go func(i int, address string) {
+				defer wg.Done()
+				writers <- struct{}{}
+				defer func() { <-writers }()
+				processAddressTo(&outputs[i], address, processor, false, "", logfile)
+			}(i, address)
+		}
+		wg.Wait()
+
+		for i := range outputs {
+			os.Stdout.Write(outputs[i].Bytes())
 		}
 	}
 }
 
+// summaryCategories labels the Discovery Summary lines, in display order
+var summaryCategories = [...]string{
+	"Device Groups",
+	"Direct Security Rules",
+	"Indirect Security Rules (via Address Groups)",
+	"Address Groups",
+	"NAT Rules",
+	"Service Groups",
+	"Redundant Addresses",
+}
+
 // ProcessAddress processes a single address and generates results
 func ProcessAddress(address string, panProcessor *processor.PANLogProcessor, interactiveMode bool, outputOverride string, configFile string) bool {
+	return processAddressTo(os.Stdout, address, panProcessor, interactiveMode, outputOverride, configFile)
+}
+
+// processAddressTo is ProcessAddress with its messages written to out. Interactive
+// mode also prints section frames and prompts, so it expects out to be os.Stdout.
+func processAddressTo(out io.Writer, address string, panProcessor *processor.PANLogProcessor, interactiveMode bool, outputOverride string, configFile string) bool {
 	if interactiveMode {
 		ui.PrintSectionHeader(fmt.Sprintf("Analyzing Address Object: %s", address))
 	}
 
 	result, exists := panProcessor.Results[address]
 	if !exists || len(result.MatchingLines) == 0 {
-		fmt.Printf(ui.ColorWarning("  WARNING: No matches found for '%s'\n"), address)
+		fmt.Fprintf(out, ui.ColorWarning("  WARNING: No matches found for '%s'\n"), address)
 		if interactiveMode {
 			ui.PrintSectionFooter()
 		}
@@ -178,8 +231,8 @@ func ProcessAddress(address string, panProcessor *processor.PANLogProcessor, int
 	}
 
 	if interactiveMode {
-		fmt.Printf(ui.ColorSuccess("  Discovered %s configuration lines\n"), ui.ColorHighlight(utils.FormatNumber(len(result.MatchingLines))))
-		fmt.Println(ui.ColorInfo("  Processing relationships and dependencies..."))
+		fmt.Fprintf(out, ui.ColorSuccess("  Discovered %s configuration lines\n"), ui.ColorHighlight(utils.FormatNumber(len(result.MatchingLines))))
+		fmt.Fprintln(out, ui.ColorInfo("  Processing relationships and dependencies..."))
 	}
 
 	// Format results
@@ -192,41 +245,49 @@ func ProcessAddress(address string, panProcessor *processor.PANLogProcessor, int
 	}
 
 	if interactiveMode {
-		fmt.Printf(ui.ColorInfo("  Generating comprehensive report: %s\n"), ui.ColorHighlight("outputs/"+outputFile))
+		fmt.Fprintf(out, ui.ColorInfo("  Generating comprehensive report: %s\n"), ui.ColorHighlight("outputs/"+outputFile))
 	}
 
-	err := utils.WriteResults(outputFile, address, result.MatchingLines, itemsDict)
+	err := utils.WriteResults(outputFile, address, result, itemsDict)
 	if err != nil {
-		fmt.Printf(ui.ColorError("Error writing results: %v\n"), err)
+		fmt.Fprintf(out, ui.ColorError("Error writing results: %v\n"), err)
 		return false
 	}
 
 	if interactiveMode {
-		fmt.Println(ui.ColorSuccess("  Analysis complete! Report generated successfully"))
+		fmt.Fprintln(out, ui.ColorSuccess("  Analysis complete! Report generated successfully"))
 		ui.PrintSectionFooter()
 		ui.PrintSectionHeader("Discovery Summary")
 	} else {
-		fmt.Printf(ui.ColorSuccess("Results written to %s\n"), outputFile)
+		fmt.Fprintf(out, ui.ColorSuccess("Results written to %s\n"), outputFile)
+	}
+
+	// Count each category once for both the summary and the total, in summaryCategories order
+	categoryCounts := [len(summaryCategories)]int{
+		len(itemsDict.DeviceGroups),
+		len(itemsDict.DirectSecurityRules),
+		len(itemsDict.IndirectSecurityRules),
+		len(itemsDict.AddressGroups),
+		len(itemsDict.NATRules),
+		len(itemsDict.ServiceGroups),
+		len(itemsDict.RedundantAddresses),
 	}
 
-	// Enhanced summary
-	ui.PrintResultsSummary("Device Groups", len(itemsDict.DeviceGroups))
-	ui.PrintResultsSummary("Direct Security Rules", len(itemsDict.DirectSecurityRules))
-	ui.PrintResultsSummary("Indirect Security Rules (via Address Groups)", len(itemsDict.IndirectSecurityRules))
-	ui.PrintResultsSummary("Address Groups", len(itemsDict.AddressGroups))
-	ui.PrintResultsSummary("NAT Rules", len(itemsDict.NATRules))
-	ui.PrintResultsSummary("Service Groups", len(itemsDict.ServiceGroups))
-	ui.PrintResultsSummary("Redundant Addresses", len(itemsDict.RedundantAddresses))
+	// Enhanced summary, written in one go
+	var summary strings.Builder
+	totalFindings := 0
+	for i, count := range categoryCounts {
+		summary.WriteString(ui.FormatResultsSummary(summaryCategories[i], count))
+		totalFindings += count
+	}
+	fmt.Fprint(out, summary.String())
 
 	if interactiveMode {
 		ui.PrintSectionFooter()
-		totalFindings := len(itemsDict.DeviceGroups) + len(itemsDict.DirectSecurityRules) +
-			len(itemsDict.IndirectSecurityRules) + len(itemsDict.AddressGroups) +
-			len(itemsDict.NATRules) + len(itemsDict.ServiceGroups) + len(itemsDict.RedundantAddresses)
 
 		if totalFindings > 0 {
-			fmt.Printf(ui.ColorSuccess("\nAnalysis revealed %s total configuration items!\n"), ui.ColorHighlight(utils.FormatNumber(totalFindings)))
-			fmt.Printf(ui.ColorInfo("Detailed report saved to: %s\n"), ui.ColorHighlight("outputs/"+outputFile))
+			fmt.Fprintf(out, ui.ColorSuccess("\nAnalysis revealed %s total configuration items!\n"), ui.ColorHighlight(utils.FormatNumber(totalFindings)))
+			fmt.Fprintf(out, ui.ColorInfo("Detailed report saved to: %s\n"), ui.ColorHighlight("outputs/"+outputFile))
 
 			// Offer to generate commands for adding new address to discovered groups
 			if len(itemsDict.AddressGroups) > 0 {
@@ -246,7 +307,7 @@ func ProcessAddress(address string, panProcessor *processor.PANLogProcessor, int
 				)
 			}
 		} else {
-			fmt.Println(ui.ColorWarning("No configuration relationships found for this address object."))
+			fmt.Fprintln(out, ui.ColorWarning("No configuration relationships found for this address object."))
 		}
 	}
 
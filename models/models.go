@@ -15,12 +15,13 @@ type Patterns struct {
 	SecurityRulesQuoted   *regexp.Regexp
 	SecurityRulesUnquoted *regexp.Regexp
 	DeviceGroup           *regexp.Regexp
-	AddressGroupShared    *regexp.Regexp
-	AddressGroupDevice    *regexp.Regexp
+	AddressGroup          *regexp.Regexp
 	NatRule               *regexp.Regexp
 	ServiceGroup          *regexp.Regexp
 	IPNetmask             *regexp.Regexp
 	AddressByIP           *regexp.Regexp
+	DeviceGroupSet        *regexp.Regexp
+	SharedAddress         *regexp.Regexp
 }
 
 // AddressGroup represents an address group
@@ -40,17 +41,16 @@ type RedundantAddress struct {
 
 // AddressResult holds all analysis results for a single address
 type AddressResult struct {
-	MatchingLines        []string           `json:"matching_lines"`
-	DeviceGroups         map[string]bool    `json:"device_groups"`
-	DirectRules          map[string]string  `json:"direct_rules"`
-	DirectRuleContexts   map[string]string  `json:"direct_rule_contexts"`
-	IndirectRules        map[string]string  `json:"indirect_rules"`
-	IndirectRuleContexts map[string]string  `json:"indirect_rule_contexts"`
-	AddressGroups        []AddressGroup     `json:"address_groups"`
-	NATRules             map[string]bool    `json:"nat_rules"`
-	ServiceGroups        map[string]bool    `json:"service_groups"`
-	IPNetmask            string             `json:"ip_netmask"`
-	RedundantAddresses   []RedundantAddress `json:"redundant_addresses"`
+	MatchingLines      []string                 `json:"matching_lines"`
+	DeviceGroups       map[string]bool          `json:"device_groups"`
+	DirectRules        map[string]RuleReference `json:"direct_rules"`
+	IndirectRules      map[string]RuleReference `json:"indirect_rules"`
+	AddressGroups      []AddressGroup           `json:"address_groups"`
+	AddressGroupKeys   map[string]bool          `json:"-"` // Keys of AddressGroups, for dedup
+	NATRules           map[string]bool          `json:"nat_rules"`
+	ServiceGroups      map[string]bool          `json:"service_groups"`
+	IPNetmask          string                   `json:"ip_netmask"`
+	RedundantAddresses []RedundantAddress       `json:"redundant_addresses"`
 }
 
 // FormattedResults represents the formatted output structure
@@ -66,8 +66,9 @@ type FormattedResults struct {
 
 // IPAddress represents an IP address with associated line
 type IPAddress struct {
-	Name string
-	Line string
+	Name        string
+	Line        string
+	DeviceGroup string // "shared", the device group, or "Unknown"
 }
 
 // GroupInfo holds group information with associated address
@@ -91,7 +92,7 @@ type ReferencedGroup struct {
 // GroupMembers holds address group with its members
 type GroupMembers struct {
 	Info    AddressGroup
-	Members []string
+	Members map[string]bool
 }
 
 // RuleContext holds rule name with context information
@@ -100,6 +101,13 @@ type RuleContext struct {
 	Context string
 }
 
+// RuleReference records where a rule that references an address lives and how it
+// references it
+type RuleReference struct {
+	DeviceGroup string `json:"device_group"`
+	Context     string `json:"context"`
+}
+
 // Config represents configuration from JSON files
 type Config struct {
 	LogFile     string   `json:"log_file"`
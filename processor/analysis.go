@@ -2,7 +2,6 @@ package processor
 
 import (
 	"fmt"
-	"regexp"
 	"strings"
 
 	"palo-pan-parsing/models"
@@ -11,9 +10,6 @@ import (
 
 // findRedundantAddresses finds addresses with same IP netmask (optimized for large files)
 func (p *PANLogProcessor) findRedundantAddresses(ipToAddresses map[string][]models.IPAddress, targetAddresses map[string]bool) {
-	// Pre-compile regex pattern for device group extraction
-	deviceGroupPattern := regexp.MustCompile(`set\s+device-group\s+(\S+)\s+address`)
-	
 	// Only process IP addresses that have duplicates AND contain target addresses
 	for ipNetmask, addrList := range ipToAddresses {
 		if len(addrList) <= 1 {
@@ -38,16 +34,6 @@ func (p *PANLogProcessor) findRedundantAddresses(ipToAddresses map[string][]mode
 
 		// Second pass: build redundant address lists for each target
 		for _, addr := range addrList {
-			// Determine device group once
-			var dg string
-			if strings.HasPrefix(addr.Line, "set shared") {
-				dg = "shared"
-			} else if matches := deviceGroupPattern.FindStringSubmatch(addr.Line); matches != nil {
-				dg = matches[1]
-			} else {
-				dg = "Unknown"
-			}
-
 			// Add this address as redundant for all other targets in the same IP group
 			for targetName := range targetNamesInList {
 				if addr.Name != targetName {
@@ -57,7 +43,7 @@ func (p *PANLogProcessor) findRedundantAddresses(ipToAddresses map[string][]mode
 					targetToRedundant[targetName] = append(targetToRedundant[targetName], models.RedundantAddress{
 						Name:        addr.Name,
 						IPNetmask:   ipNetmask,
-						DeviceGroup: dg,
+						DeviceGroup: addr.DeviceGroup,
 					})
 				}
 			}
@@ -70,40 +56,59 @@ func (p *PANLogProcessor) findRedundantAddresses(ipToAddresses map[string][]mode
 	}
 }
 
-// findIndirectRulesMemory finds security rules that reference address groups containing our addresses (in-memory version)
-func (p *PANLogProcessor) findIndirectRulesMemory(allLines []string, addresses []string) {
-	// Do a comprehensive scan for ALL address groups containing our target addresses
-	// This ensures we don't miss groups that weren't discovered during the initial pass
-	groupToAddresses := make(map[string]map[string]bool) // group name -> set of addresses
-	allGroups := make(map[string]models.AddressGroup)    // group name -> group info
+// addressGroupLine is an address-group definition collected during the main scan
+type addressGroupLine struct {
+	Line string
+	Info models.AddressGroup
+}
 
-	// Pre-create address lookup map for faster checking
+// securityRuleLine is a security rule line collected during the main scan. The
+// device group is carried along when the scan already had to resolve it.
+type securityRuleLine struct {
+	Line        string
+	DeviceGroup string
+	Resolved    bool
+}
+
+// findIndirectRulesMemory finds security rules that reference address groups containing our addresses (in-memory version)
+func (p *PANLogProcessor) findIndirectRulesMemory(groupLines []addressGroupLine, ruleLines []securityRuleLine, addresses []string) {
+	// Check ALL address groups collected during the main scan for our target addresses
+	// This ensures we don't miss groups that weren't discovered through matching lines
+	groupToAddresses := make(map[string]map[string]string) // group name -> contained address -> base rule context
+	allGroups := make(map[string]models.AddressGroup)      // group name -> group info
+	var groupNames []string
+
+	// One automaton finds every target address in a group line in a single scan
 	addressLookup := make(map[string]bool)
+	var targets []string
 	for _, addr := range addresses {
-		addressLookup[addr] = true
+		if !addressLookup[addr] {
+			addressLookup[addr] = true
+			targets = append(targets, addr)
+		}
 	}
+	addressMatcher := newStringMatcher(targets)
+	var matchedAddresses []int
 
-	// Scan all lines for address groups containing our target addresses
-	for _, line := range allLines {
-		// Fast pre-filter for address-group lines only
-		if !strings.Contains(line, "address-group") {
-			continue
+	for _, group := range groupLines {
+		matchedAddresses = addressMatcher.findAll(group.Line, matchedAddresses[:0])
+
+		// Check which of our target addresses this group contains. The rule context
+		// only depends on the group and the address, so it is built here once
+		// rather than for every rule line that references the group.
+		containedAddresses := make(map[string]string, len(matchedAddresses))
+		for _, idx := range matchedAddresses {
+			addr := targets[idx]
+			containedAddresses[addr] = indirectRuleContext(group.Info, addr)
 		}
-		
-		if agInfo := p.extractAddressGroup(line); agInfo != nil {
-			// Check which of our target addresses this group contains
-			containedAddresses := make(map[string]bool)
-			for addr := range addressLookup {
-				if strings.Contains(line, addr) {
-					containedAddresses[addr] = true
-				}
-			}
 
-			// If this group contains any of our addresses, store it
-			if len(containedAddresses) > 0 {
-				allGroups[agInfo.Name] = *agInfo
-				groupToAddresses[agInfo.Name] = containedAddresses
+		// If this group contains any of our addresses, store it
+		if len(containedAddresses) > 0 {
+			if _, exists := allGroups[group.Info.Name]; !exists {
+				groupNames = append(groupNames, group.Info.Name)
 			}
+			allGroups[group.Info.Name] = group.Info
+			groupToAddresses[group.Info.Name] = containedAddresses
 		}
 	}
 
@@ -111,51 +116,16 @@ func (p *PANLogProcessor) findIndirectRulesMemory(allLines []string, addresses [
 		return
 	}
 
-	// Pre-compile all regex patterns for performance
-	groupPatterns := make(map[string]*regexp.Regexp)
-	for name := range allGroups {
-		groupPatterns[name] = regexp.MustCompile(regexp.QuoteMeta(name))
-	}
-
-	totalLines := len(allLines)
-	progressInterval := 200000 // Less frequent progress reporting
-	lastProgress := 0
-
-	for lineNum, line := range allLines {
-		// Show progress less frequently for better performance
-		if lineNum > 0 && lineNum%progressInterval == 0 && lineNum != lastProgress {
-			percentage := float64(lineNum) / float64(totalLines) * 100
-			p.printf("    Analyzing line %s/%s (%.0f%%)\n",
-				utils.FormatNumber(lineNum), utils.FormatNumber(totalLines), percentage)
-			lastProgress = lineNum
-		}
+	// One automaton finds every referenced group in a single scan of each rule line
+	groupMatcher := newStringMatcher(groupNames)
+	var matchedGroups []int
 
-		// Fast pre-filter for security rules
-		if !strings.Contains(line, "security") {
-			continue
-		}
-		if !strings.Contains(line, "rules") && !strings.Contains(line, "rule") {
-			continue
-		}
+	for _, ruleLine := range ruleLines {
+		line := ruleLine.Line
 
 		// Check if line references any of our address groups
-		var matchedGroups []string
-		hasMatches := false
-
-		// Pre-filter with fast string search before regex
-		for name, pattern := range groupPatterns {
-			if idx := strings.Index(line, name); idx != -1 {
-				if pattern.MatchString(line) {
-					if !hasMatches {
-						matchedGroups = make([]string, 0, len(groupPatterns))
-						hasMatches = true
-					}
-					matchedGroups = append(matchedGroups, name)
-				}
-			}
-		}
-
-		if !hasMatches {
+		matchedGroups = groupMatcher.findAll(line, matchedGroups[:0])
+		if len(matchedGroups) == 0 {
 			continue
 		}
 
@@ -165,131 +135,93 @@ func (p *PANLogProcessor) findIndirectRulesMemory(allLines []string, addresses [
 			continue
 		}
 
-		var deviceGroup string
-		if matches := p.Patterns.DeviceGroup.FindStringSubmatch(line); matches != nil {
-			deviceGroup = matches[1]
-		} else {
+		deviceGroup := ruleLine.DeviceGroup
+		if !ruleLine.Resolved {
+			deviceGroup = p.lineDeviceGroup(line)
+		}
+		if deviceGroup == "" {
 			deviceGroup = "Unknown"
 		}
 
+		// Locate the destination and source fields once for every group on this line
+		destSegment, hasDest := fieldSegment(line, "destination")
+		sourceSegment, hasSource := fieldSegment(line, "source")
+
 		// Add to results for each relevant address
-		for _, groupName := range matchedGroups {
-			groupInfo := allGroups[groupName]
+		for _, idx := range matchedGroups {
+			groupName := groupNames[idx]
 			containedAddresses := groupToAddresses[groupName]
 
 			// Add rule to each address contained in this group
-			for targetAddr := range containedAddresses {
+			for targetAddr, context := range containedAddresses {
 				// Skip if already in direct rules
 				if _, exists := p.Results[targetAddr].DirectRules[ruleName]; exists {
 					continue
 				}
 
-				p.Results[targetAddr].IndirectRules[ruleName] = deviceGroup
-
-				// Create context
-				context := fmt.Sprintf("references address-group '%s' that contains %s", groupName, targetAddr)
-				if groupInfo.Context == "shared" {
-					context = fmt.Sprintf("references shared address-group '%s' that contains %s", groupName, targetAddr)
-				} else if groupInfo.Context == "device-group" {
-					context = fmt.Sprintf("references address-group '%s' from device-group '%s' that contains %s",
-						groupName, groupInfo.DeviceGroup, targetAddr)
-				}
-
 				// Add usage context
-				if strings.Contains(line, "destination") {
-					destParts := strings.Split(line, "destination")
-					if len(destParts) > 1 && strings.Contains(destParts[1], groupName) {
+				if hasDest {
+					if strings.Contains(destSegment, groupName) {
 						context += " (in destination)"
 					}
-				} else if strings.Contains(line, "source") {
-					sourceParts := strings.Split(line, "source")
-					if len(sourceParts) > 1 && strings.Contains(sourceParts[1], groupName) {
-						context += " (in source)"
-					}
+				} else if hasSource && strings.Contains(sourceSegment, groupName) {
+					context += " (in source)"
 				}
 
-				p.Results[targetAddr].IndirectRuleContexts[ruleName] = context
+				p.Results[targetAddr].IndirectRules[ruleName] = models.RuleReference{
+					DeviceGroup: deviceGroup,
+					Context:     context,
+				}
 			}
 		}
 	}
 }
 
+// indirectRuleContext describes a rule reaching address through the given group
+func indirectRuleContext(group models.AddressGroup, address string) string {
+	switch group.Context {
+	case "shared":
+		return fmt.Sprintf("references shared address-group '%s' that contains %s", group.Name, address)
+	case "device-group":
+		return fmt.Sprintf("references address-group '%s' from device-group '%s' that contains %s",
+			group.Name, group.DeviceGroup, address)
+	}
+	return fmt.Sprintf("references address-group '%s' that contains %s", group.Name, address)
+}
+
 // findNestedAddressGroupsMemory finds address groups that contain other address groups (in-memory version)
-func (p *PANLogProcessor) findNestedAddressGroupsMemory(allLines []string, addresses []string) {
+func (p *PANLogProcessor) findNestedAddressGroupsMemory(groupLines []addressGroupLine, addresses []string) {
 	targetAddresses := make(map[string]bool)
 	for _, addr := range addresses {
 		targetAddresses[addr] = true
 	}
 
-	allAddressGroups := make(map[string]models.GroupMembers)
-
-	totalLines := len(allLines)
-	progressInterval := 300000 // Less frequent progress for better performance
-	lastProgress := 0
-
-	// Collect ALL address groups and their members from memory
-	for lineNum, line := range allLines {
-		// Show progress less frequently for better performance
-		if lineNum > 0 && lineNum%progressInterval == 0 && lineNum != lastProgress {
-			percentage := float64(lineNum) / float64(totalLines) * 100
-			p.printf("    Mapping line %s/%s (%.0f%%)\n",
-				utils.FormatNumber(lineNum), utils.FormatNumber(totalLines), percentage)
-			lastProgress = lineNum
-		}
-
-		// Fast pre-filter for address-group lines
-		if !strings.Contains(line, "address-group") {
-			continue
-		}
-
-		// Check for shared address groups
-		if matches := p.Patterns.AddressGroupShared.FindStringSubmatch(line); matches != nil {
-			groupName, definition := matches[1], matches[2]
-			members := utils.ParseGroupMembers(definition)
-			groupInfo := models.AddressGroup{
-				Name:       groupName,
-				Context:    "shared",
-				Definition: definition,
-			}
-			allAddressGroups[groupName] = models.GroupMembers{
-				Info:    groupInfo,
-				Members: members,
-			}
-			continue
-		}
-
-		// Check for device group address groups
-		if matches := p.Patterns.AddressGroupDevice.FindStringSubmatch(line); matches != nil {
-			deviceGroup, groupName, definition := matches[1], matches[2], matches[3]
-			members := utils.ParseGroupMembers(definition)
-			groupInfo := models.AddressGroup{
-				Name:        groupName,
-				Context:     "device-group",
-				DeviceGroup: deviceGroup,
-				Definition:  definition,
-			}
-			allAddressGroups[groupName] = models.GroupMembers{
-				Info:    groupInfo,
-				Members: members,
-			}
+	// Build the member sets for every address group collected during the main scan.
+	// Device groups often repeat the same definition, so each distinct definition is
+	// parsed once and its (read-only) member set shared.
+	allAddressGroups := make(map[string]models.GroupMembers, len(groupLines))
+	membersByDefinition := make(map[string]map[string]bool, len(groupLines))
+	for _, group := range groupLines {
+		members, parsed := membersByDefinition[group.Info.Definition]
+		if !parsed {
+			members = utils.ParseGroupMembers(group.Info.Definition)
+			membersByDefinition[group.Info.Definition] = members
+		}
+		allAddressGroups[group.Info.Name] = models.GroupMembers{
+			Info:    group.Info,
+			Members: members,
 		}
 	}
 
-	// Second pass: find nested relationships
+	// Find nested relationships
 	for _, gm := range allAddressGroups {
 		// Check if this group contains other groups that contain our target addresses
 		relevantForAddresses := make(map[string]bool)
 
-		for _, member := range gm.Members {
+		for member := range gm.Members {
 			// Check if member is another address group that contains our targets
 			if nestedGm, exists := allAddressGroups[member]; exists {
-				for _, targetAddr := range addresses {
-					for _, nestedMember := range nestedGm.Members {
-						if nestedMember == targetAddr {
-							relevantForAddresses[targetAddr] = true
-						}
-					}
-				}
+				intersectMembers(relevantForAddresses, targetAddresses, nestedGm.Members)
 			}
 
 			// Also check if member is directly one of our target addresses
@@ -299,23 +231,25 @@ func (p *PANLogProcessor) findNestedAddressGroupsMemory(allLines []string, addre
 		}
 
 		// Add this group to results for relevant addresses if not already present
+		groupKey := addressGroupKey(gm.Info)
 		for targetAddr := range relevantForAddresses {
-			// Check if already exists
-			found := false
-			for _, existing := range p.Results[targetAddr].AddressGroups {
-				if existing.Name == gm.Info.Name && existing.Context == gm.Info.Context {
-					if gm.Info.Context == "device-group" && existing.DeviceGroup == gm.Info.DeviceGroup {
-						found = true
-						break
-					} else if gm.Info.Context == "shared" {
-						found = true
-						break
-					}
-				}
-			}
-			if !found {
-				p.Results[targetAddr].AddressGroups = append(p.Results[targetAddr].AddressGroups, gm.Info)
+			result := p.Results[targetAddr]
+			if !result.AddressGroupKeys[groupKey] {
+				result.AddressGroups = append(result.AddressGroups, gm.Info)
+				result.AddressGroupKeys[groupKey] = true
 			}
 		}
 	}
 }
+
+// intersectMembers adds every address present in both sets to dst, walking the smaller set
+func intersectMembers(dst, a, b map[string]bool) {
+	if len(b) < len(a) {
+		a, b = b, a
+	}
+	for addr := range a {
+		if b[addr] {
+			dst[addr] = true
+		}
+	}
+}
@@ -0,0 +1,195 @@
+package processor
+
+import (
+	"bufio"
+	"crypto/sha256"
+	"encoding/gob"
+	"encoding/hex"
+	"fmt"
+	"io"
+	"os"
+	"path/filepath"
+	"runtime/debug"
+	"sync"
+
+	"palo-pan-parsing/models"
+)
+
+// The result cache is opt-in (PANLogProcessor.CacheResults, the -cache flag). It keeps
+// one entry per configuration file in palo-pan-parsing under os.UserCacheDir(), e.g.
+// ~/.cache/palo-pan-parsing on Linux. Entries hold parsed configuration data, so the
+// directory is private to the user; deleting it clears the cache.
+
+// resultCacheFormat changes whenever the layout of resultCacheEntry changes
+const resultCacheFormat = 1
+
+// resultCacheEntry is what the result cache keeps for one configuration file
+type resultCacheEntry struct {
+	Key       string // see resultCacheKey
+	Addresses []string
+	Results   map[string]*models.AddressResult
+}
+
+// cacheBuildID identifies the code that produced cached results: the VCS revision
+// of a clean build, otherwise a hash of the running executable. It is "" if
+// neither is available, which disables the cache.
+var cacheBuildID = sync.OnceValue(func() string {
+	if info, ok := debug.ReadBuildInfo(); ok {
+		var revision string
+		modified := false
+		for _, setting := range info.Settings {
+			switch setting.Key {
+			case "vcs.revision":
+				revision = setting.Value
+			case "vcs.modified":
+				modified = setting.Value == "true"
+			}
+		}
+		if revision != "" && !modified {
+			return "vcs:" + revision
+		}
+	}
+
+	executable, err := os.Executable()
+	if err != nil {
+		return ""
+	}
+	file, err := os.Open(executable)
+	if err != nil {
+		return ""
+	}
+	defer file.Close()
+	hash := sha256.New()
+	if _, err := io.Copy(hash, file); err != nil {
+		return ""
+	}
+	return "exe:" + hex.EncodeToString(hash.Sum(nil))
+})
+
+// resultCacheKey identifies a scan of the file contents in data for addresses by
+// this build, or returns "" if the build can't be identified
+func resultCacheKey(data []byte, addresses []string) string {
+	buildID := cacheBuildID()
+	if buildID == "" {
+		return ""
+	}
+	hash := sha256.New()
+	fmt.Fprintf(hash, "%d\x00%s\x00", resultCacheFormat, buildID)
+	for _, addr := range addresses {
+		fmt.Fprintf(hash, "%s\x00", addr)
+	}
+	contentSum := sha256.Sum256(data)
+	hash.Write(contentSum[:])
+	return hex.EncodeToString(hash.Sum(nil))
+}
+
+// resultCachePath returns the cache file for filePath, or "" if there is no cache directory.
+// Each configuration file has a single entry, so the cache does not grow with every run.
+func resultCachePath(filePath string) string {
+	cacheDir, err := os.UserCacheDir()
+	if err != nil {
+		return ""
+	}
+	absPath, err := filepath.Abs(filePath)
+	if err != nil {
+		return ""
+	}
+	sum := sha256.Sum256([]byte(absPath))
+	return filepath.Join(cacheDir, "palo-pan-parsing", hex.EncodeToString(sum[:16])+".gob")
+}
+
+// loadCachedResults returns the results cached for filePath under key, or nil if the
+// entry was written for other contents, addresses or another build
+func loadCachedResults(filePath, key string) map[string]*models.AddressResult {
+	cachePath := resultCachePath(filePath)
+	if cachePath == "" || key == "" {
+		return nil
+	}
+	file, err := os.Open(cachePath)
+	if err != nil {
+		return nil
+	}
+	defer file.Close()
+
+	var entry resultCacheEntry
+	if err := gob.NewDecoder(bufio.NewReader(file)).Decode(&entry); err != nil {
+		return nil
+	}
+	if entry.Key != key {
+		return nil
+	}
+
+	// gob decodes maps that were nil when saved as nil, so make every map usable
+	for _, addr := range entry.Addresses {
+		result := entry.Results[addr]
+		if result == nil {
+			return nil
+		}
+		restoreResultMaps(result)
+	}
+	return entry.Results
+}
+
+// saveCachedResults records the results of scanning filePath for addresses under key.
+// The cache is only an optimization, so failing to write it is not an error.
+func saveCachedResults(filePath, key string, addresses []string, results map[string]*models.AddressResult) {
+	cachePath := resultCachePath(filePath)
+	if cachePath == "" || key == "" {
+		return
+	}
+	if err := os.MkdirAll(filepath.Dir(cachePath), 0700); err != nil {
+		return
+	}
+
+	entry := resultCacheEntry{
+		Key:       key,
+		Addresses: addresses,
+		Results:   make(map[string]*models.AddressResult, len(addresses)),
+	}
+	for _, addr := range addresses {
+		entry.Results[addr] = results[addr]
+	}
+
+	// Write to a temporary file (created 0600) and rename it so a reader never
+	// sees half an entry
+	file, err := os.CreateTemp(filepath.Dir(cachePath), "results-*.tmp")
+	if err != nil {
+		return
+	}
+	writer := bufio.NewWriterSize(file, 256*1024)
+	err = gob.NewEncoder(writer).Encode(&entry)
+	if err == nil {
+		err = writer.Flush()
+	}
+	if closeErr := file.Close(); err == nil {
+		err = closeErr
+	}
+	if err == nil {
+		err = os.Rename(file.Name(), cachePath)
+	}
+	if err != nil {
+		os.Remove(file.Name())
+	}
+}
+
+// restoreResultMaps replaces the nil maps of a decoded result with empty ones
+func restoreResultMaps(result *models.AddressResult) {
+	if result.DeviceGroups == nil {
+		result.DeviceGroups = make(map[string]bool)
+	}
+	if result.DirectRules == nil {
+		result.DirectRules = make(map[string]models.RuleReference)
+	}
+	if result.IndirectRules == nil {
+		result.IndirectRules = make(map[string]models.RuleReference)
+	}
+	if result.AddressGroupKeys == nil {
+		result.AddressGroupKeys = make(map[string]bool)
+	}
+	if result.NATRules == nil {
+		result.NATRules = make(map[string]bool)
+	}
+	if result.ServiceGroups == nil {
+		result.ServiceGroups = make(map[string]bool)
+	}
+}
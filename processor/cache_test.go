@@ -0,0 +1,123 @@
+package processor
+
+import (
+	"os"
+	"path/filepath"
+	"reflect"
+	"testing"
+
+	"palo-pan-parsing/models"
+)
+
+// useTempCacheDir points os.UserCacheDir at a directory private to the test
+func useTempCacheDir(t *testing.T) string {
+	t.Helper()
+	dir := t.TempDir()
+	t.Setenv("XDG_CACHE_HOME", dir)
+	t.Setenv("HOME", dir)
+	t.Setenv("LocalAppData", dir)
+	if got, err := os.UserCacheDir(); err != nil || got != dir {
+		t.Skipf("os.UserCacheDir() = %q, %v; cannot redirect it on this platform", got, err)
+	}
+	return dir
+}
+
+// cachedScan runs ProcessFileSinglePass with the result cache enabled and
+// reports whether the results came from the cache
+func cachedScan(t *testing.T, path string, addresses []string) (*PANLogProcessor, bool) {
+	t.Helper()
+	p := NewPANLogProcessor()
+	p.Silent = true
+	p.CacheResults = true
+	if err := p.ProcessFileSinglePass(path, addresses); err != nil {
+		t.Fatal(err)
+	}
+	// Only a real scan loads the file's lines
+	return p, p.loaded == nil
+}
+
+func TestResultCache(t *testing.T) {
+	cacheDir := useTempCacheDir(t)
+	path := writeTestConfig(t)
+	// "missing" never matches, so its result round trips with only empty maps
+	addresses := []string{"web-1", "db-1", "missing"}
+
+	uncached := NewPANLogProcessor()
+	uncached.Silent = true
+	if err := uncached.ProcessFileSinglePass(path, addresses); err != nil {
+		t.Fatal(err)
+	}
+	if _, err := os.Stat(filepath.Join(cacheDir, "palo-pan-parsing")); !os.IsNotExist(err) {
+		t.Fatalf("scan without CacheResults touched the cache directory: %v", err)
+	}
+
+	fresh, hit := cachedScan(t, path, addresses)
+	if hit {
+		t.Fatal("first cached scan hit an empty cache")
+	}
+	if !reflect.DeepEqual(fresh.Results, uncached.Results) {
+		t.Fatal("scan with CacheResults gave different results from one without")
+	}
+
+	t.Run("hit", func(t *testing.T) {
+		cached, hit := cachedScan(t, path, addresses)
+		if !hit {
+			t.Fatal("unchanged file and addresses missed the cache")
+		}
+		if !reflect.DeepEqual(cached.Results, fresh.Results) {
+			t.Fatalf("cached results differ from a fresh scan:\ncached: %+v\nfresh:  %+v", cached.Results, fresh.Results)
+		}
+	})
+
+	t.Run("nil maps restored", func(t *testing.T) {
+		// Entries written with nil maps decode with nil maps, and every map field
+		// of a loaded result must be usable
+		other := filepath.Join(t.TempDir(), "other.log")
+		saveCachedResults(other, "key", []string{"a"}, map[string]*models.AddressResult{
+			"a": {MatchingLines: []string{"set shared address a ip-netmask 10.0.0.9/32"}},
+		})
+		loaded := loadCachedResults(other, "key")
+		if loaded == nil {
+			t.Fatal("saved entry missed the cache")
+		}
+		result := reflect.ValueOf(loaded["a"]).Elem()
+		for i := 0; i < result.NumField(); i++ {
+			if field := result.Field(i); field.Kind() == reflect.Map && field.IsNil() {
+				t.Errorf("loaded result has nil %s map", result.Type().Field(i).Name)
+			}
+		}
+	})
+
+	t.Run("address change miss", func(t *testing.T) {
+		for _, changed := range [][]string{
+			{"web-1", "db-1"},
+			{"db-1", "web-1", "missing"},
+			{"web-1", "db-1", "missing", "web-dup"},
+		} {
+			if _, hit := cachedScan(t, path, changed); hit {
+				t.Errorf("addresses %v hit the cache entry for %v", changed, addresses)
+			}
+			// Put the entry for the original addresses back
+			cachedScan(t, path, addresses)
+		}
+	})
+
+	t.Run("content change miss", func(t *testing.T) {
+		data, err := os.ReadFile(path)
+		if err != nil {
+			t.Fatal(err)
+		}
+		data = append(data, "set device-group dg-d pre-rulebase security rules late-rule destination web-1\n"...)
+		if err := os.WriteFile(path, data, 0644); err != nil {
+			t.Fatal(err)
+		}
+
+		changed, hit := cachedScan(t, path, addresses)
+		if hit {
+			t.Fatal("changed file contents hit the cache")
+		}
+		if _, ok := changed.Results["web-1"].DirectRules["late-rule"]; !ok {
+			t.Fatal("scan of changed contents is missing the new rule")
+		}
+	})
+}
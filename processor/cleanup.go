@@ -1,9 +1,7 @@
 package processor
 
 import (
-	"bufio"
 	"fmt"
-	"os"
 	"regexp"
 	"strings"
 
@@ -52,6 +50,11 @@ func (p *PANLogProcessor) determineTargetScope(allLines []string, targetAddress
 	targetPattern := regexp.MustCompile(fmt.Sprintf(`set\s+(shared|device-group\s+(\S+))\s+address\s+%s\s+ip-netmask`, regexp.QuoteMeta(targetAddress)))
 
 	for _, line := range allLines {
+		// The pattern needs both literals, so plain substring checks rule out
+		// almost every line before the regex engine runs
+		if !strings.Contains(line, "ip-netmask") || !strings.Contains(line, targetAddress) {
+			continue
+		}
 		if matches := targetPattern.FindStringSubmatch(line); matches != nil {
 			if matches[1] == "shared" {
 				return "shared", ""
@@ -106,6 +109,7 @@ func (p *PANLogProcessor) analyzeRedundantUsage(allLines []string, redundantAddr
 	p.printf("    Analyzing usage of redundant address '%s'...\n", redundantAddress)
 
 	matchCount := 0
+	seenGroups := make(map[string]bool) // addressGroupKey of each entry in usage.AddressGroups
 
 	for lineNum, line := range allLines {
 		// Progress reporting for large files
@@ -123,29 +127,24 @@ func (p *PANLogProcessor) analyzeRedundantUsage(allLines []string, redundantAddr
 
 		matchCount++
 
-		// Extract device group from line
-		if matches := p.Patterns.DeviceGroup.FindStringSubmatch(line); matches != nil {
-			usage.UsedInDGs[matches[1]] = true
+		// Extract device group from line, once for everything below
+		deviceGroup := p.lineDeviceGroup(line)
+		if deviceGroup != "" {
+			usage.UsedInDGs[deviceGroup] = true
 		}
 
 		// Extract IP netmask if this is the definition line
 		if strings.Contains(line, "ip-netmask") {
-			if matches := p.Patterns.IPNetmask.FindStringSubmatch(line); matches != nil && matches[1] == redundantAddress {
-				usage.IPNetmask = matches[2]
+			if matches := p.Patterns.IPNetmask.FindStringSubmatch(line); matches != nil && matches[2] == redundantAddress {
+				usage.IPNetmask = matches[3]
 			}
 		}
 
 		// Extract address groups
 		if agInfo := p.extractAddressGroup(line); agInfo != nil && strings.Contains(agInfo.Definition, redundantAddress) {
 			// Check if already exists
-			found := false
-			for _, existing := range usage.AddressGroups {
-				if existing.Name == agInfo.Name && existing.Context == agInfo.Context && existing.DeviceGroup == agInfo.DeviceGroup {
-					found = true
-					break
-				}
-			}
-			if !found {
+			if groupKey := addressGroupKey(*agInfo); !seenGroups[groupKey] {
+				seenGroups[groupKey] = true
 				usage.AddressGroups = append(usage.AddressGroups, *agInfo)
 				p.printf("        Found in address group: %s (context: %s)\n", agInfo.Name, agInfo.Context)
 			}
@@ -154,10 +153,7 @@ func (p *PANLogProcessor) analyzeRedundantUsage(allLines []string, redundantAddr
 		// Extract security rules
 		ruleName, context := p.extractSecurityRule(line, redundantAddress)
 		if ruleName != "" {
-			var deviceGroup string
-			if matches := p.Patterns.DeviceGroup.FindStringSubmatch(line); matches != nil {
-				deviceGroup = matches[1]
-			} else {
+			if deviceGroup == "" {
 				deviceGroup = "Unknown"
 			}
 			usage.SecurityRules[ruleName] = deviceGroup
@@ -397,31 +393,17 @@ func (p *PANLogProcessor) generateServiceGroupReplacementCommands(analysis *mode
 
 // AnalyzeRedundantAddressCleanupWithReparse re-parses the config file and performs cleanup analysis
 func (p *PANLogProcessor) AnalyzeRedundantAddressCleanupWithReparse(filePath, targetAddress string) (*models.CleanupAnalysis, error) {
-	// Re-read the file into memory for cleanup analysis
-	file, err := os.Open(filePath)
-	if err != nil {
-		return nil, fmt.Errorf("error opening file for cleanup analysis: %w", err)
+	// Reuse the lines from the analysis scan when the file has not changed
+	if allLines := p.loadedLines(filePath); allLines != nil {
+		p.printf("  Reusing %s configuration lines loaded for analysis\n", utils.FormatNumber(len(allLines)))
+		return p.AnalyzeRedundantAddressCleanup(allLines, targetAddress)
 	}
-	defer file.Close()
 
 	p.printf("  Re-reading configuration file for cleanup analysis...\n")
 
-	// Read all lines into memory
-	var allLines []string
-	scanner := bufio.NewScanner(file)
-
-	// Set a large buffer size for performance with big files
-	buf := make([]byte, 64*1024)
-	scanner.Buffer(buf, 1024*1024)
-
-	for scanner.Scan() {
-		line := strings.TrimSpace(scanner.Text())
-		if line != "" {
-			allLines = append(allLines, line)
-		}
-	}
-
-	if err := scanner.Err(); err != nil {
+	// Read all lines into memory with a single read of the whole file
+	allLines, err := readConfigLines(filePath)
+	if err != nil {
 		return nil, fmt.Errorf("error reading file for cleanup analysis: %w", err)
 	}
 
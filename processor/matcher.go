@@ -0,0 +1,171 @@
+package processor
+
+import (
+	"strings"
+	"unicode/utf8"
+)
+
+// stringMatcher finds every occurrence of a fixed set of strings in a line with a
+// single left-to-right scan (Aho-Corasick automaton). It keeps the plain substring
+// semantics of strings.Contains, so "someserver" still matches "someserver-rebuild".
+type stringMatcher struct {
+	patterns   []string
+	classes    [256]int32 // byte -> equivalence class, 0 for bytes that appear in no pattern
+	numClasses int
+	next       []int32 // dense transition table indexed by state*numClasses + class, see newStringMatcher
+	output     [][]int // pattern indexes ending at each state
+	dictLink   []int32 // nearest state on the failure chain with output, -1 if none
+	empty      []int   // empty patterns match every line
+	minLen     int     // length of the shortest non-empty pattern
+	firstBytes string  // distinct first bytes of the patterns, "" when the root can't be skipped
+}
+
+// maxFirstBytes is the most distinct first bytes the root skip in findAll is used for
+const maxFirstBytes = 4
+
+// newStringMatcher builds the automaton for the given patterns
+func newStringMatcher(patterns []string) *stringMatcher {
+	m := &stringMatcher{patterns: patterns}
+
+	// Collapse the alphabet to the bytes actually used by the patterns
+	m.numClasses = 1
+	for _, pattern := range patterns {
+		for i := 0; i < len(pattern); i++ {
+			if m.classes[pattern[i]] == 0 {
+				m.classes[pattern[i]] = int32(m.numClasses)
+				m.numClasses++
+			}
+		}
+	}
+
+	// Build the trie
+	m.addState()
+	for idx, pattern := range patterns {
+		if pattern == "" {
+			m.empty = append(m.empty, idx)
+			continue
+		}
+		if m.minLen == 0 || len(pattern) < m.minLen {
+			m.minLen = len(pattern)
+		}
+		state := int32(0)
+		for i := 0; i < len(pattern); i++ {
+			slot := int(state)*m.numClasses + int(m.classes[pattern[i]])
+			if m.next[slot] == 0 {
+				child := m.addState()
+				m.next[slot] = child
+			}
+			state = m.next[slot]
+		}
+		m.output[state] = append(m.output[state], idx)
+	}
+
+	// Outside a partial match the scan can jump to the next byte that starts a
+	// pattern. strings.IndexAny takes chars as runes, so it is only used when
+	// every first byte is ASCII, and only for a few of them, where it is faster
+	// than walking the table.
+	var firstSeen [256]bool
+	asciiFirst := true
+	for _, pattern := range patterns {
+		if pattern != "" && !firstSeen[pattern[0]] {
+			firstSeen[pattern[0]] = true
+			m.firstBytes += pattern[:1]
+			asciiFirst = asciiFirst && pattern[0] < utf8.RuneSelf
+		}
+	}
+	if !asciiFirst || len(m.firstBytes) > maxFirstBytes {
+		m.firstBytes = ""
+	}
+
+	// Resolve failure links breadth-first and turn the trie into a full DFA
+	fail := make([]int32, len(m.output))
+	queue := make([]int32, 0, len(m.output))
+	for class := 0; class < m.numClasses; class++ {
+		if child := m.next[class]; child > 0 {
+			queue = append(queue, child)
+		}
+	}
+	for len(queue) > 0 {
+		state := queue[0]
+		queue = queue[1:]
+		if f := fail[state]; len(m.output[f]) > 0 {
+			m.dictLink[state] = f
+		} else {
+			m.dictLink[state] = m.dictLink[f]
+		}
+
+		base := int(state) * m.numClasses
+		failBase := int(fail[state]) * m.numClasses
+		for class := 0; class < m.numClasses; class++ {
+			if child := m.next[base+class]; child > 0 {
+				fail[child] = m.next[failBase+class]
+				queue = append(queue, child)
+			} else {
+				m.next[base+class] = m.next[failBase+class]
+			}
+		}
+	}
+
+	// Store each target as its premultiplied row offset so the scan needs no
+	// multiply, and flip the bits of targets that report a match so the scan
+	// only has to test the sign
+	for slot, target := range m.next {
+		offset := target * int32(m.numClasses)
+		if len(m.output[target]) > 0 || m.dictLink[target] >= 0 {
+			offset = ^offset
+		}
+		m.next[slot] = offset
+	}
+
+	return m
+}
+
+// addState appends an empty state and returns its index
+func (m *stringMatcher) addState() int32 {
+	state := int32(len(m.output))
+	m.next = append(m.next, make([]int32, m.numClasses)...)
+	m.output = append(m.output, nil)
+	m.dictLink = append(m.dictLink, -1)
+	return state
+}
+
+// findAll appends the index of every pattern found in text to dst, each index once
+func (m *stringMatcher) findAll(text string, dst []int) []int {
+	dst = append(dst, m.empty...)
+	// Text shorter than every pattern cannot contain one
+	if len(text) < m.minLen {
+		return dst
+	}
+	skipRoot := m.firstBytes != ""
+	offset := int32(0)
+	for i := 0; i < len(text); i++ {
+		if skipRoot && offset == 0 {
+			skip := strings.IndexAny(text[i:], m.firstBytes)
+			if skip < 0 {
+				break
+			}
+			i += skip
+		}
+		offset = m.next[offset+m.classes[text[i]]]
+		if offset >= 0 {
+			continue
+		}
+		offset = ^offset
+		for s := offset / int32(m.numClasses); s > 0; s = m.dictLink[s] {
+			for _, idx := range m.output[s] {
+				dst = appendUnique(dst, idx)
+			}
+		}
+	}
+	return dst
+}
+
+// appendUnique appends idx to dst unless it is already present
+func appendUnique(dst []int, idx int) []int {
+	for _, existing := range dst {
+		if existing == idx {
+			return dst
+		}
+	}
+	return append(dst, idx)
+}
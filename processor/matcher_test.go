@@ -0,0 +1,153 @@
+package processor
+
+import (
+	"math/rand"
+	"slices"
+	"strings"
+	"testing"
+)
+
+// containsAll is the reference for stringMatcher.findAll: the index of every
+// pattern that strings.Contains finds in text
+func containsAll(patterns []string, text string) []int {
+	var want []int
+	for idx, pattern := range patterns {
+		if strings.Contains(text, pattern) {
+			want = append(want, idx)
+		}
+	}
+	return want
+}
+
+func checkFindAll(t *testing.T, m *stringMatcher, text string) {
+	t.Helper()
+	got := m.findAll(text, nil)
+	sorted := slices.Clone(got)
+	slices.Sort(sorted)
+	if len(slices.Compact(slices.Clone(sorted))) != len(got) {
+		t.Fatalf("findAll(%q) with %q reported duplicates: %v", text, m.patterns, got)
+	}
+	if want := containsAll(m.patterns, text); !slices.Equal(sorted, want) {
+		t.Fatalf("findAll(%q) with %q = %v, want %v", text, m.patterns, sorted, want)
+	}
+}
+
+func TestStringMatcher(t *testing.T) {
+	tests := []struct {
+		name       string
+		patterns   []string
+		minLen     int
+		firstBytes string
+		texts      []string
+	}{
+		{
+			name:       "substring semantics",
+			patterns:   []string{"someserver"},
+			minLen:     10,
+			firstBytes: "s",
+			texts:      []string{"set address someserver-rebuild", "someserve", "xsomeserverx", ""},
+		},
+		{
+			name:       "overlapping patterns",
+			patterns:   []string{"abcd", "bcde", "cd", "dex"},
+			minLen:     2,
+			firstBytes: "abcd",
+			texts:      []string{"abcdex", "xbcdey", "abcabcd", "cdcdcd", "bcdbcde"},
+		},
+		{
+			name:       "patterns that prefix others",
+			patterns:   []string{"host-1", "host-10", "host-100", "host"},
+			minLen:     4,
+			firstBytes: "h",
+			texts:      []string{"host-1000", "host-10 host-1", "set address host-2", "hos", "host-"},
+		},
+		{
+			name:       "duplicate patterns",
+			patterns:   []string{"grp-10", "grp-10", "grp"},
+			minLen:     3,
+			firstBytes: "g",
+			texts:      []string{"address-group grp-10 static", "grp-1"},
+		},
+		{
+			name:       "empty and short text",
+			patterns:   []string{"web1", "db"},
+			minLen:     2,
+			firstBytes: "wd",
+			texts:      []string{"", "d", "db", "we", "web", "web1"},
+		},
+		{
+			name:       "empty pattern matches every line",
+			patterns:   []string{"", "x"},
+			minLen:     1,
+			firstBytes: "x",
+			texts:      []string{"", "x", "abc"},
+		},
+		{
+			name:       "single first byte",
+			patterns:   []string{"host-1", "host-30", "host-99"},
+			minLen:     6,
+			firstBytes: "h",
+			texts:      []string{"hhhhost-30", "set device-group dg host-99 host-1", "no match here"},
+		},
+		{
+			name:       "more first bytes than the root skip handles",
+			patterns:   []string{"a1", "b2", "c3", "d4", "e5", "f6"},
+			minLen:     2,
+			firstBytes: "",
+			texts:      []string{"xxf6", "a1b2c3", "e4e5", "zzzz"},
+		},
+		{
+			name:       "non-ASCII first bytes",
+			patterns:   []string{"é-srv", "ü", "host"},
+			minLen:     2,
+			firstBytes: "",
+			texts:      []string{"set address é-srv ip-netmask", "größe", "\xc3host", "\xff\xfeü"},
+		},
+		{
+			name:       "non-ASCII text with ASCII patterns",
+			patterns:   []string{"srv", "db-2"},
+			minLen:     3,
+			firstBytes: "sd",
+			texts:      []string{"é srv ü", "\xffdb-2\xff", "日本db-2語", "é"},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			m := newStringMatcher(tt.patterns)
+			if m.minLen != tt.minLen || m.firstBytes != tt.firstBytes {
+				t.Fatalf("newStringMatcher(%q) has minLen %d, firstBytes %q; want %d, %q",
+					tt.patterns, m.minLen, m.firstBytes, tt.minLen, tt.firstBytes)
+			}
+			for _, text := range tt.texts {
+				checkFindAll(t, m, text)
+			}
+		})
+	}
+}
+
+func TestStringMatcherRandom(t *testing.T) {
+	r := rand.New(rand.NewSource(1))
+	randomString := func(alphabet string, n int) string {
+		b := make([]byte, n)
+		for i := range b {
+			b[i] = alphabet[r.Intn(len(alphabet))]
+		}
+		return string(b)
+	}
+
+	// Small alphabets force overlaps and shared prefixes; the wider ones cover
+	// both sides of the root skip limit and non-ASCII bytes
+	alphabets := []string{"ab", "ab-1", "abcdefgh-1", "a\xc3\xa9\xff-"}
+	for iter := 0; iter < 5000; iter++ {
+		alphabet := alphabets[iter%len(alphabets)]
+		patterns := make([]string, 1+r.Intn(6))
+		for i := range patterns {
+			patterns[i] = randomString(alphabet, r.Intn(5))
+		}
+		m := newStringMatcher(patterns)
+		for j := 0; j < 10; j++ {
+			checkFindAll(t, m, randomString(alphabet, r.Intn(24)))
+		}
+	}
+}
@@ -5,9 +5,11 @@ import (
 	"fmt"
 	"os"
 	"regexp"
+	"runtime"
 	"sort"
 	"strings"
-	"sync"
+	"unicode/utf8"
+	"unsafe"
 
 	"palo-pan-parsing/models"
 	"palo-pan-parsing/utils"
@@ -19,6 +21,16 @@ type PANLogProcessor struct {
 	Patterns         *models.Patterns
 	Silent           bool                  // If true, suppress all output
 	ProgressCallback func(float64, string) // Callback for progress updates
+	CacheResults     bool                  // If true, reuse and store scan results in the result cache (see cache.go)
+
+	loaded *loadedConfig // Lines from the last ProcessFileSinglePass, reused by cleanup analysis
+}
+
+// loadedConfig remembers a configuration file's lines and the file state they were read from
+type loadedConfig struct {
+	path  string
+	info  os.FileInfo
+	lines []string
 }
 
 // NewPatterns creates and compiles all regex patterns
@@ -29,12 +41,13 @@ func NewPatterns() *models.Patterns {
 		SecurityRulesQuoted:   regexp.MustCompile(`security\s+rules\s+"([^"]+)"`),
 		SecurityRulesUnquoted: regexp.MustCompile(`security\s+rules\s+(\S+)`),
 		DeviceGroup:           regexp.MustCompile(`device-group\s+(\S+)`),
-		AddressGroupShared:    regexp.MustCompile(`set\s+shared\s+address-group\s+(\S+)\s+static\s+(.+)`),
-		AddressGroupDevice:    regexp.MustCompile(`set\s+device-group\s+(\S+)\s+address-group\s+(\S+)\s+static\s+(.+)`),
+		AddressGroup:          regexp.MustCompile(`set\s+(?:(shared)|device-group\s+(\S+))\s+address-group\s+(\S+)\s+static\s+(.+)`),
 		NatRule:               regexp.MustCompile(`nat-rule\s+(\S+)`),
 		ServiceGroup:          regexp.MustCompile(`service-group\s+(\S+)`),
-		IPNetmask:             regexp.MustCompile(`set\s+(?:shared|device-group\s+\S+)\s+address\s+(\S+)\s+ip-netmask\s+([\d\.]+/\d+)`),
+		IPNetmask:             regexp.MustCompile(`set\s+(?:shared|device-group\s+(\S+))\s+address\s+(\S+)\s+ip-netmask\s+([\d\.]+/\d+)`),
 		AddressByIP:           regexp.MustCompile(`set\s+(?:shared|device-group\s+(\S+))\s+address\s+(\S+)\s+ip-netmask\s+`),
+		DeviceGroupSet:        regexp.MustCompile(`set\s+device-group\s+(\S+)`),
+		SharedAddress:         regexp.MustCompile(`set\s+shared\s+address`),
 	}
 }
 
@@ -61,31 +74,93 @@ func (p *PANLogProcessor) println(msg string) {
 	}
 }
 
-// NewAddressResult creates a new initialized AddressResult with pre-allocated capacity
+// NewAddressResult creates a new initialized AddressResult. Every target gets one
+// up front and each parallel scan chunk makes its own, while most stay small or
+// empty, so nothing is pre-sized and the slices start out nil.
 func NewAddressResult() *models.AddressResult {
 	return &models.AddressResult{
-		MatchingLines:        make([]string, 0, 100),                // Pre-allocate for 100 lines
-		DeviceGroups:         make(map[string]bool, 10),             // Pre-allocate for 10 device groups
-		DirectRules:          make(map[string]string, 50),           // Pre-allocate for 50 rules
-		DirectRuleContexts:   make(map[string]string, 50),           // Pre-allocate for 50 contexts
-		IndirectRules:        make(map[string]string, 20),           // Pre-allocate for 20 indirect rules
-		IndirectRuleContexts: make(map[string]string, 20),           // Pre-allocate for 20 contexts
-		AddressGroups:        make([]models.AddressGroup, 0, 20),    // Pre-allocate for 20 groups
-		NATRules:             make(map[string]bool, 10),             // Pre-allocate for 10 NAT rules
-		ServiceGroups:        make(map[string]bool, 10),             // Pre-allocate for 10 service groups
-		RedundantAddresses:   make([]models.RedundantAddress, 0, 5), // Pre-allocate for 5 redundant addresses
+		DeviceGroups:     make(map[string]bool),
+		DirectRules:      make(map[string]models.RuleReference),
+		IndirectRules:    make(map[string]models.RuleReference),
+		AddressGroupKeys: make(map[string]bool),
+		NATRules:         make(map[string]bool),
+		ServiceGroups:    make(map[string]bool),
+	}
+}
+
+// readConfigLines reads the whole file in one call and slices it into trimmed,
+// non-empty lines. The lines share the file's buffer, so no per-line copies are made.
+func readConfigLines(filePath string) ([]string, error) {
+	data, err := os.ReadFile(filePath)
+	if err != nil {
+		return nil, err
+	}
+	return splitConfigLines(data), nil
+}
+
+// splitConfigLines slices file contents into trimmed, non-empty lines that share
+// data's buffer. data must not be modified afterwards.
+func splitConfigLines(data []byte) []string {
+	if len(data) == 0 {
+		return nil
+	}
+
+	// The buffer is never modified after this point, so view it as a string in place
+	content := unsafe.String(&data[0], len(data))
+	lines := make([]string, 0, strings.Count(content, "\n")+1)
+	for len(content) > 0 {
+		var line string
+		if idx := strings.IndexByte(content, '\n'); idx >= 0 {
+			line, content = content[:idx], content[idx+1:]
+		} else {
+			line, content = content, ""
+		}
+		// Most lines are neither indented nor padded, so only trim when an end could be whitespace
+		if n := len(line); n > 0 && (mayBeSpace(line[0]) || mayBeSpace(line[n-1])) {
+			line = strings.TrimSpace(line)
+		}
+		if line != "" {
+			lines = append(lines, line)
+		}
+	}
+	return lines
+}
+
+// mayBeSpace reports whether b could be part of whitespace trimmed by strings.TrimSpace
+func mayBeSpace(b byte) bool {
+	return b <= ' ' || b >= utf8.RuneSelf
+}
+
+// loadedLines returns the lines kept from the last scan of filePath, or nil if
+// that file was not scanned or has changed since
+func (p *PANLogProcessor) loadedLines(filePath string) []string {
+	if p.loaded == nil || p.loaded.path != filePath {
+		return nil
+	}
+	info, err := os.Stat(filePath)
+	if err != nil || info.Size() != p.loaded.info.Size() || !info.ModTime().Equal(p.loaded.info.ModTime()) {
+		return nil
 	}
+	return p.loaded.lines
 }
 
 // ProcessFileSinglePass processes the file once, loading into memory for optimal performance
 func (p *PANLogProcessor) ProcessFileSinglePass(filePath string, addresses []string) error {
 	addressSet := make(map[string]bool)
+	var targets []string
 	for _, addr := range addresses {
+		if !addressSet[addr] {
+			targets = append(targets, addr)
+		}
 		addressSet[addr] = true
 		p.Results[addr] = NewAddressResult()
 	}
 
-	ipToAddresses := make(map[string][]models.IPAddress)
+	// Results indexed like targets, so the scan reaches them without map lookups
+	targetResults := make([]*models.AddressResult, len(targets))
+	for idx, addr := range targets {
+		targetResults[idx] = p.Results[addr]
+	}
 
 	// Get file info
 	fileInfo, err := os.Stat(filePath)
@@ -97,33 +172,37 @@ func (p *PANLogProcessor) ProcessFileSinglePass(filePath string, addresses []str
 		fileInfo.Name(),
 		utils.FormatBytes(fileInfo.Size()))
 
-	// Open and read file
-	file, err := os.Open(filePath)
-	if err != nil {
-		return fmt.Errorf("error opening file: %w", err)
-	}
-	defer file.Close()
-
 	p.println("  Reading file into memory...")
 
-	// Read all lines into memory
-	var allLines []string
-	scanner := bufio.NewScanner(file)
-
-	// Set a large buffer size for performance with big files
-	buf := make([]byte, 64*1024)
-	scanner.Buffer(buf, 1024*1024)
+	// Read the whole file in one call
+	data, err := os.ReadFile(filePath)
+	if err != nil {
+		return fmt.Errorf("error reading file: %w", err)
+	}
 
-	for scanner.Scan() {
-		line := strings.TrimSpace(scanner.Text())
-		if line != "" {
-			allLines = append(allLines, line)
+	// With caching enabled, contents this build already scanned for the same
+	// addresses need no new scan
+	var cacheKey string
+	if p.CacheResults {
+		cacheKey = resultCacheKey(data, addresses)
+		if cached := loadCachedResults(filePath, cacheKey); cached != nil {
+			for addr, result := range cached {
+				p.Results[addr] = result
+			}
+			p.println("  Reusing cached analysis of unchanged configuration file")
+			if p.ProgressCallback != nil {
+				p.ProgressCallback(1, "Loaded cached analysis")
+			}
+			return nil
 		}
 	}
 
-	if err := scanner.Err(); err != nil {
-		return fmt.Errorf("error reading file: %w", err)
-	}
+	// Slice all lines in place in the file's buffer
+	allLines := splitConfigLines(data)
+
+	// Matching lines already keep the file's buffer alive, so holding on to the
+	// line list as well lets cleanup analysis skip reading the file again
+	p.loaded = &loadedConfig{path: filePath, info: fileInfo, lines: allLines}
 
 	totalLines := len(allLines)
 	p.printf("  Loaded %s configuration lines into memory\n",
@@ -132,81 +211,80 @@ func (p *PANLogProcessor) ProcessFileSinglePass(filePath string, addresses []str
 
 	// Note: Using simple substring matching to match Python behavior
 	// This ensures addresses like "someserver-rebuild" match when searching for "someserver"
+	ms := &mainScan{
+		matcher:     newStringMatcher(targets),
+		targets:     targets,
+		targetIndex: make(map[string]int, len(targets)),
+	}
+	for idx, addr := range targets {
+		ms.targetIndex[addr] = idx
+	}
 
 	// Process all lines in memory with optimized batch processing
 	progressInterval := 20000 // Very frequent progress reporting for great UX
 	if totalLines > 5000000 {
 		progressInterval = 40000
 	}
-	lastProgress := 0
-
-	// Use a mutex for thread-safe IP address tracking
-	var ipMutex sync.Mutex
-
-	// Process lines in optimized loop
-	for lineNum, line := range allLines {
-		// Show progress less frequently for better performance
-		if lineNum > 0 && lineNum%progressInterval == 0 && lineNum != lastProgress {
-			progress := float64(lineNum) / float64(totalLines)
-			percentage := progress * 100
-			message := fmt.Sprintf("Processing line %s/%s (%.0f%%)",
-				utils.FormatNumber(lineNum), utils.FormatNumber(totalLines), percentage)
 
-			// Call progress callback if available
-			if p.ProgressCallback != nil {
-				p.ProgressCallback(progress, message)
-			} else {
-				p.printf("    %s\n", message)
-			}
-			lastProgress = lineNum
+	// Lines are scanned in progress-sized chunks. With several CPUs the chunks are
+	// scanned in parallel and merged back in file order, so results are unchanged.
+	chunkCount := (totalLines + progressInterval - 1) / progressInterval
+	chunkLines := func(chunk int) []string {
+		start := chunk * progressInterval
+		return allLines[start:min(start+progressInterval, totalLines)]
+	}
+	workers := min(runtime.GOMAXPROCS(0), chunkCount)
+	lastPercent := 0 // Nothing is reported at the start of the file
+
+	scan := &lineScan{results: targetResults}
+	if workers <= 1 {
+		for chunk := 0; chunk < chunkCount; chunk++ {
+			p.reportScanProgress(chunk*progressInterval, totalLines, &lastPercent)
+			p.scanLines(scan, chunkLines(chunk), ms)
 		}
-
-		// Fast early rejection for empty or very short lines
-		if len(line) < 10 {
-			continue
+	} else {
+		chunkScans := make([]*lineScan, chunkCount)
+		chunkDone := make([]chan struct{}, chunkCount)
+		pending := make(chan int, chunkCount)
+		for chunk := range chunkDone {
+			chunkDone[chunk] = make(chan struct{})
+			pending <- chunk
 		}
-
-		// Check for IP netmask definitions first (optimized for common case)
-		if strings.Contains(line, "ip-netmask") {
-			if matches := p.Patterns.IPNetmask.FindStringSubmatch(line); matches != nil {
-				addrName, ipNetmask := matches[1], matches[2]
-				if addressSet[addrName] {
-					p.Results[addrName].IPNetmask = ipNetmask
+		close(pending)
+
+		for w := 0; w < workers; w++ {
+			go func() {
+				for chunk := range pending {
+					chunkScan := &lineScan{results: make([]*models.AddressResult, len(targets))}
+					p.scanLines(chunkScan, chunkLines(chunk), ms)
+					chunkScans[chunk] = chunkScan
+					close(chunkDone[chunk])
 				}
-				// Track all IP mappings for redundancy detection (thread-safe)
-				ipMutex.Lock()
-				ipToAddresses[ipNetmask] = append(ipToAddresses[ipNetmask], models.IPAddress{
-					Name: addrName,
-					Line: line,
-				})
-				ipMutex.Unlock()
-			}
+			}()
 		}
 
-		// Fast pre-filter: only check detailed patterns if line might contain addresses
-		hasAddress := false
-		var matchingAddresses []string
-
-		// Fast address matching - simple substring search (matches Python behavior)
-		for addr := range addressSet {
-			// Simple substring check - matches any occurrence like Python version
-			if strings.Contains(line, addr) {
-				if !hasAddress {
-					matchingAddresses = make([]string, 0, len(addressSet)) // Pre-allocate capacity
-					hasAddress = true
-				}
-				matchingAddresses = append(matchingAddresses, addr)
-			}
+		// Progress is reported from here so callbacks never run concurrently
+		for chunk := range chunkScans {
+			p.reportScanProgress(chunk*progressInterval, totalLines, &lastPercent)
+			<-chunkDone[chunk]
+			scan.merge(chunkScans[chunk])
+			chunkScans[chunk] = nil
 		}
+	}
 
-		if !hasAddress {
-			continue
+	// Group the ip-netmask definitions by IP for redundancy detection. Only IPs
+	// that a target is defined with can hold redundant addresses, so the other
+	// definitions are never bucketed.
+	targetIPs := make(map[string]bool)
+	for _, entry := range scan.ipEntries {
+		if addressSet[entry.Address.Name] {
+			targetIPs[entry.IPNetmask] = true
 		}
-
-		// Process line for each matching address
-		for _, address := range matchingAddresses {
-			p.Results[address].MatchingLines = append(p.Results[address].MatchingLines, line)
-			p.extractItemsFromLine(line, address)
+	}
+	ipToAddresses := make(map[string][]models.IPAddress, len(targetIPs))
+	for _, entry := range scan.ipEntries {
+		if targetIPs[entry.IPNetmask] {
+			ipToAddresses[entry.IPNetmask] = append(ipToAddresses[entry.IPNetmask], entry.Address)
 		}
 	}
 
@@ -216,85 +294,145 @@ func (p *PANLogProcessor) ProcessFileSinglePass(filePath string, addresses []str
 	p.println("  Analyzing redundant address objects...")
 	p.findRedundantAddresses(ipToAddresses, addressSet)
 
-	// Find indirect security rules (using in-memory data)
+	// Find indirect security rules (using the rule and group lines collected above)
 	p.println("  Discovering indirect security rule relationships...")
-	p.findIndirectRulesMemory(allLines, addresses)
+	p.findIndirectRulesMemory(scan.groupLines, scan.ruleLines, addresses)
 
-	// Find nested address groups (using in-memory data)
+	// Find nested address groups (using the group lines collected above)
 	p.println("  Mapping nested address group hierarchies...")
-	p.findNestedAddressGroupsMemory(allLines, addresses)
+	p.findNestedAddressGroupsMemory(scan.groupLines, addresses)
+
+	// Keep the results for the next run against the same contents and addresses
+	if cacheKey != "" {
+		saveCachedResults(filePath, cacheKey, addresses, p.Results)
+	}
 
 	return nil
 }
 
-// extractItemsFromLine extracts all relevant items from a single line
-func (p *PANLogProcessor) extractItemsFromLine(line, address string) {
-	result := p.Results[address]
+// reportScanProgress reports main scan progress when it reaches lineNum. Reports
+// that would repeat the whole percentage in lastPercent are skipped.
+func (p *PANLogProcessor) reportScanProgress(lineNum, totalLines int, lastPercent *int) {
+	percent := lineNum * 100 / totalLines
+	if percent == *lastPercent {
+		return
+	}
+	*lastPercent = percent
+
+	progress := float64(lineNum) / float64(totalLines)
+	percentage := progress * 100
+	message := fmt.Sprintf("Processing line %s/%s (%.0f%%)",
+		utils.FormatNumber(lineNum), utils.FormatNumber(totalLines), percentage)
+
+	// Call progress callback if available
+	if p.ProgressCallback != nil {
+		p.ProgressCallback(progress, message)
+	} else {
+		p.printf("    %s\n", message)
+	}
+}
+
+// deviceGroupPrefix starts configuration lines scoped to a device group
+const deviceGroupPrefix = "set device-group "
+
+// prefixDeviceGroup returns the device group of a line starting with deviceGroupPrefix,
+// or "" for any other line. Device group scoped lines almost always start with the
+// prefix, so the name is sliced out directly and callers fall back to a regex.
+func prefixDeviceGroup(line string) string {
+	if !strings.HasPrefix(line, deviceGroupPrefix) {
+		return ""
+	}
+	name := line[len(deviceGroupPrefix):]
+	if end := strings.IndexAny(name, " \t\n\f\r"); end >= 0 {
+		name = name[:end]
+	}
+	return name
+}
 
-	// Cache device group match to avoid multiple regex calls
-	deviceGroupMatch := p.Patterns.DeviceGroup.FindStringSubmatch(line)
-	if deviceGroupMatch != nil {
-		result.DeviceGroups[deviceGroupMatch[1]] = true
+// lineDeviceGroup returns the device group named in a line, or "" if there is none
+func (p *PANLogProcessor) lineDeviceGroup(line string) string {
+	if name := prefixDeviceGroup(line); name != "" {
+		return name
+	}
+	if !strings.Contains(line, "device-group") {
+		return ""
 	}
+	if matches := p.Patterns.DeviceGroup.FindStringSubmatch(line); matches != nil {
+		return matches[1]
+	}
+	return ""
+}
 
-	// Extract security rules with context (reuse cached device group)
-	ruleName, context := p.extractSecurityRule(line, address)
+// extractItemsFromLine extracts all relevant items from a single line into the
+// address's result, given the line's device group as returned by lineDeviceGroup
+func (p *PANLogProcessor) extractItemsFromLine(result *models.AddressResult, line, address, deviceGroup string) {
+	// Every pattern below needs its keyword literally, so cheap substring checks
+	// decide which regexes are worth running on this line
+	hasSecurity := strings.Contains(line, "security")
+	hasAddressGroup := strings.Contains(line, "address-group")
+	hasNatRule := strings.Contains(line, "nat-rule")
+	hasServiceGroup := strings.Contains(line, "service-group")
+
+	if deviceGroup != "" {
+		result.DeviceGroups[deviceGroup] = true
+	}
+
+	// Extract security rules with context
+	var ruleName, context string
+	if hasSecurity {
+		ruleName, context = p.extractSecurityRule(line, address)
+	}
 	if ruleName != "" {
-		var deviceGroup string
-		if deviceGroupMatch != nil {
-			deviceGroup = deviceGroupMatch[1]
-		} else {
+		if deviceGroup == "" {
 			deviceGroup = "Unknown"
 		}
-		result.DirectRules[ruleName] = deviceGroup
-		result.DirectRuleContexts[ruleName] = context
+		result.DirectRules[ruleName] = models.RuleReference{DeviceGroup: deviceGroup, Context: context}
 	}
 
 	// Extract address groups
-	if agInfo := p.extractAddressGroup(line); agInfo != nil {
-		// Check if this group is already in the list (optimized)
-		groupKey := agInfo.Name + "|" + agInfo.Context + "|" + agInfo.DeviceGroup
-		found := false
-		for _, existing := range result.AddressGroups {
-			existingKey := existing.Name + "|" + existing.Context + "|" + existing.DeviceGroup
-			if existingKey == groupKey {
-				found = true
-				break
+	if hasAddressGroup {
+		if agInfo := p.extractAddressGroup(line); agInfo != nil {
+			// Check if this group is already in the list
+			groupKey := addressGroupKey(*agInfo)
+			if !result.AddressGroupKeys[groupKey] {
+				result.AddressGroups = append(result.AddressGroups, *agInfo)
+				result.AddressGroupKeys[groupKey] = true
 			}
 		}
-		if !found {
-			result.AddressGroups = append(result.AddressGroups, *agInfo)
-		}
 	}
 
 	// Extract NAT rules
-	if matches := p.Patterns.NatRule.FindStringSubmatch(line); matches != nil {
-		result.NATRules[matches[1]] = true
+	if hasNatRule {
+		if matches := p.Patterns.NatRule.FindStringSubmatch(line); matches != nil {
+			result.NATRules[matches[1]] = true
+		}
 	}
 
 	// Extract service groups
-	if matches := p.Patterns.ServiceGroup.FindStringSubmatch(line); matches != nil {
-		result.ServiceGroups[matches[1]] = true
+	if hasServiceGroup {
+		if matches := p.Patterns.ServiceGroup.FindStringSubmatch(line); matches != nil {
+			result.ServiceGroups[matches[1]] = true
+		}
 	}
 }
 
+// addressGroupKey identifies an address group by name, context and device group
+func addressGroupKey(group models.AddressGroup) string {
+	return group.Name + "|" + group.Context + "|" + group.DeviceGroup
+}
+
 // extractSecurityRule extracts security rule name and determines context
 func (p *PANLogProcessor) extractSecurityRule(line, address string) (string, string) {
 	var ruleName string
 
-	// Try different patterns for security rules
-	patterns := []*regexp.Regexp{
-		p.Patterns.SecurityRuleQuoted,
-		p.Patterns.SecurityRuleUnquoted,
-		p.Patterns.SecurityRulesQuoted,
-		p.Patterns.SecurityRulesUnquoted,
+	// Dispatch on the literal keywords each pattern requires so only the
+	// patterns that can match are run, in the same order of preference
+	hasQuote := strings.IndexByte(line, '"') >= 0
+	if strings.Contains(line, "security-rule") {
+		ruleName = matchRuleName(line, hasQuote, p.Patterns.SecurityRuleQuoted, p.Patterns.SecurityRuleUnquoted)
 	}
-
-	for _, pattern := range patterns {
-		if matches := pattern.FindStringSubmatch(line); matches != nil {
-			ruleName = matches[1]
-			break
-		}
+	if ruleName == "" && strings.Contains(line, "rules") {
+		ruleName = matchRuleName(line, hasQuote, p.Patterns.SecurityRulesQuoted, p.Patterns.SecurityRulesUnquoted)
 	}
 
 	if ruleName == "" {
@@ -303,29 +441,16 @@ func (p *PANLogProcessor) extractSecurityRule(line, address string) (string, str
 
 	// Determine context
 	context := "references directly"
-	if strings.Contains(line, "destination") {
-		destParts := strings.Split(line, "destination")
-		if len(destParts) > 1 {
-			afterDest := destParts[1]
-			if sourceParts := strings.Split(afterDest, "source"); len(sourceParts) > 0 {
-				if strings.Contains(sourceParts[0], address) {
-					context = "contains address in destination"
-				}
-			}
+	if segment, ok := fieldSegment(line, "destination", "source"); ok {
+		if strings.Contains(segment, address) {
+			context = "contains address in destination"
 		}
-	} else if strings.Contains(line, "source") {
-		sourceParts := strings.Split(line, "source")
-		if len(sourceParts) > 1 {
-			afterSource := sourceParts[1]
-			if destParts := strings.Split(afterSource, "destination"); len(destParts) > 0 {
-				if strings.Contains(destParts[0], address) {
-					context = "contains address in source"
-				}
-			}
+	} else if segment, ok := fieldSegment(line, "source", "destination"); ok {
+		if strings.Contains(segment, address) {
+			context = "contains address in source"
 		}
-	} else if strings.Contains(line, "service") {
-		serviceParts := strings.Split(line, "service")
-		if len(serviceParts) > 1 && strings.Contains(serviceParts[1], address) {
+	} else if segment, ok := fieldSegment(line, "service"); ok {
+		if strings.Contains(segment, address) {
 			context = "references address in service field"
 		}
 	}
@@ -333,72 +458,104 @@ func (p *PANLogProcessor) extractSecurityRule(line, address string) (string, str
 	return ruleName, context
 }
 
+// fieldSegment returns the text following the first occurrence of field, up to the
+// next occurrence of field or of any stop keyword, and whether field was found at all
+func fieldSegment(line, field string, stops ...string) (string, bool) {
+	idx := strings.Index(line, field)
+	if idx < 0 {
+		return "", false
+	}
+	segment := line[idx+len(field):]
+	if end := strings.Index(segment, field); end >= 0 {
+		segment = segment[:end]
+	}
+	for _, stop := range stops {
+		if end := strings.Index(segment, stop); end >= 0 {
+			segment = segment[:end]
+		}
+	}
+	return segment, true
+}
+
+// matchRuleName returns the rule name captured by the quoted pattern, falling back to the unquoted one
+func matchRuleName(line string, hasQuote bool, quoted, unquoted *regexp.Regexp) string {
+	if hasQuote {
+		if matches := quoted.FindStringSubmatch(line); matches != nil {
+			return matches[1]
+		}
+	}
+	if matches := unquoted.FindStringSubmatch(line); matches != nil {
+		return matches[1]
+	}
+	return ""
+}
+
 // extractAddressGroup extracts address group information with context
 func (p *PANLogProcessor) extractAddressGroup(line string) *models.AddressGroup {
-	// Check shared address groups
-	if matches := p.Patterns.AddressGroupShared.FindStringSubmatch(line); matches != nil {
+	// Shared and device group definitions share one pattern; the scope
+	// alternative that matched decides the context
+	matches := p.Patterns.AddressGroup.FindStringSubmatch(line)
+	if matches == nil {
+		return nil
+	}
+	if matches[1] != "" {
 		return &models.AddressGroup{
-			Name:       matches[1],
+			Name:       matches[3],
 			Context:    "shared",
-			Definition: matches[2],
+			Definition: matches[4],
 		}
 	}
-
-	// Check device group address groups
-	if matches := p.Patterns.AddressGroupDevice.FindStringSubmatch(line); matches != nil {
-		return &models.AddressGroup{
-			Name:        matches[2],
-			Context:     "device-group",
-			DeviceGroup: matches[1],
-			Definition:  matches[3],
-		}
+	return &models.AddressGroup{
+		Name:        matches[3],
+		Context:     "device-group",
+		DeviceGroup: matches[2],
+		Definition:  matches[4],
 	}
-
-	return nil
 }
 
-// FormatResults formats results for a specific address
+// FormatResults formats results for a specific address. The string lists are
+// sized from their source maps up front and are never nil.
 func (p *PANLogProcessor) FormatResults(address string) *models.FormattedResults {
 	result := p.Results[address]
 
 	// Format device groups
-	var deviceGroups []string
+	deviceGroups := make([]string, 0, len(result.DeviceGroups))
 	for dg := range result.DeviceGroups {
 		deviceGroups = append(deviceGroups, dg)
 	}
 	sort.Strings(deviceGroups)
 
 	// Format direct rules
-	var directRules []string
-	for rule, dg := range result.DirectRules {
-		context := result.DirectRuleContexts[rule]
+	directRules := make([]string, 0, len(result.DirectRules))
+	for rule, ref := range result.DirectRules {
+		context := ref.Context
 		if context == "" {
 			context = "direct reference"
 		}
-		directRules = append(directRules, fmt.Sprintf("%s (Device Group: %s, %s)", rule, dg, context))
+		directRules = append(directRules, fmt.Sprintf("%s (Device Group: %s, %s)", rule, ref.DeviceGroup, context))
 	}
 	sort.Strings(directRules)
 
 	// Format indirect rules
-	var indirectRules []string
-	for rule, dg := range result.IndirectRules {
-		context := result.IndirectRuleContexts[rule]
+	indirectRules := make([]string, 0, len(result.IndirectRules))
+	for rule, ref := range result.IndirectRules {
+		context := ref.Context
 		if context == "" {
 			context = "indirect reference"
 		}
-		indirectRules = append(indirectRules, fmt.Sprintf("%s (Device Group: %s, %s)", rule, dg, context))
+		indirectRules = append(indirectRules, fmt.Sprintf("%s (Device Group: %s, %s)", rule, ref.DeviceGroup, context))
 	}
 	sort.Strings(indirectRules)
 
 	// Format NAT rules
-	var natRules []string
+	natRules := make([]string, 0, len(result.NATRules))
 	for rule := range result.NATRules {
 		natRules = append(natRules, rule)
 	}
 	sort.Strings(natRules)
 
 	// Format service groups
-	var serviceGroups []string
+	serviceGroups := make([]string, 0, len(result.ServiceGroups))
 	for sg := range result.ServiceGroups {
 		serviceGroups = append(serviceGroups, sg)
 	}
@@ -415,6 +572,39 @@ func (p *PANLogProcessor) FormatResults(address string) *models.FormattedResults
 	}
 }
 
+// AddressGroupsFor returns the address groups found for an address without
+// formatting the rest of its results
+func (p *PANLogProcessor) AddressGroupsFor(address string) []models.AddressGroup {
+	if result, exists := p.Results[address]; exists {
+		return result.AddressGroups
+	}
+	return nil
+}
+
+// sharedAddressPatterns match every shared address object type. They never change,
+// so they are compiled once rather than on every device group scan.
+var sharedAddressPatterns = []*regexp.Regexp{
+	regexp.MustCompile(`set\s+shared\s+address\s+(\S+)\s+ip-netmask\s+([\d\./]+)`),
+	regexp.MustCompile(`set\s+shared\s+address\s+(\S+)\s+ip-range\s+([\d\.\-\s]+)`),
+	regexp.MustCompile(`set\s+shared\s+address\s+(\S+)\s+fqdn\s+(\S+)`),
+	regexp.MustCompile(`set\s+shared\s+address\s+(\S+)\s+ip-wildcard\s+([\d\.\*]+)`),
+}
+
+// scopeAddressPatterns returns the address object patterns for a device group, or the shared ones
+func scopeAddressPatterns(deviceGroup string) []*regexp.Regexp {
+	if deviceGroup == "shared" {
+		return sharedAddressPatterns
+	}
+
+	dgEscaped := regexp.QuoteMeta(deviceGroup)
+	return []*regexp.Regexp{
+		regexp.MustCompile(fmt.Sprintf(`set\s+device-group\s+%s\s+address\s+(\S+)\s+ip-netmask\s+([\d\./]+)`, dgEscaped)),
+		regexp.MustCompile(fmt.Sprintf(`set\s+device-group\s+%s\s+address\s+(\S+)\s+ip-range\s+([\d\.\-\s]+)`, dgEscaped)),
+		regexp.MustCompile(fmt.Sprintf(`set\s+device-group\s+%s\s+address\s+(\S+)\s+fqdn\s+(\S+)`, dgEscaped)),
+		regexp.MustCompile(fmt.Sprintf(`set\s+device-group\s+%s\s+address\s+(\S+)\s+ip-wildcard\s+([\d\.\*]+)`, dgEscaped)),
+	}
+}
+
 // ConfigurationCache holds parsed configuration data for efficient multi-group analysis
 type ConfigurationCache struct {
 	AllLines           []string
@@ -435,31 +625,12 @@ func (p *PANLogProcessor) LoadConfigurationOnce(filePath string) (*Configuration
 		fileInfo.Name(),
 		utils.FormatBytes(fileInfo.Size()))
 
-	// Open and read file
-	file, err := os.Open(filePath)
-	if err != nil {
-		return nil, fmt.Errorf("error opening file: %w", err)
-	}
-	defer file.Close()
-
 	p.println("  Reading file into memory...")
 
-	// Read all lines into memory
-	var allLines []string
-	scanner := bufio.NewScanner(file)
-
-	// Set a large buffer size for performance with big files
-	buf := make([]byte, 64*1024)
-	scanner.Buffer(buf, 1024*1024)
-
-	for scanner.Scan() {
-		line := strings.TrimSpace(scanner.Text())
-		if line != "" {
-			allLines = append(allLines, line)
-		}
-	}
-
-	if err := scanner.Err(); err != nil {
+	// Read all lines into memory with a single read of the whole file, viewing
+	// each line in place rather than copying and trimming it
+	allLines, err := readConfigLines(filePath)
+	if err != nil {
 		return nil, fmt.Errorf("error reading file: %w", err)
 	}
 
@@ -470,20 +641,16 @@ func (p *PANLogProcessor) LoadConfigurationOnce(filePath string) (*Configuration
 	// Discover device groups during the initial parse
 	deviceGroups := make(map[string]bool)
 	hasSharedAddresses := false
-	
-	deviceGroupPattern := regexp.MustCompile(`device-group\s+(\S+)`)
-	sharedPattern := regexp.MustCompile(`set\s+shared\s+address`)
 
 	p.println("  Discovering device groups...")
 	for _, line := range allLines {
 		// Check for device groups
-		if matches := deviceGroupPattern.FindStringSubmatch(line); matches != nil {
-			deviceGroupName := matches[1]
+		if deviceGroupName := p.lineDeviceGroup(line); deviceGroupName != "" {
 			deviceGroups[deviceGroupName] = true
 		}
 		
 		// Check for shared addresses
-		if sharedPattern.MatchString(line) {
+		if p.Patterns.SharedAddress.MatchString(line) {
 			hasSharedAddresses = true
 		}
 	}
@@ -515,23 +682,7 @@ func (p *PANLogProcessor) FindDuplicateAddressesInDeviceGroupFromCache(cache *Co
 	p.printf("  Analyzing device group '%s' from cached configuration...\n", deviceGroup)
 
 	// Create comprehensive patterns for all address types
-	var deviceGroupPatterns, sharedPatterns []*regexp.Regexp
-	if deviceGroup == "shared" {
-		sharedPatterns = []*regexp.Regexp{
-			regexp.MustCompile(`set\s+shared\s+address\s+(\S+)\s+ip-netmask\s+([\d\./]+)`),
-			regexp.MustCompile(`set\s+shared\s+address\s+(\S+)\s+ip-range\s+([\d\.\-\s]+)`),
-			regexp.MustCompile(`set\s+shared\s+address\s+(\S+)\s+fqdn\s+(\S+)`),
-			regexp.MustCompile(`set\s+shared\s+address\s+(\S+)\s+ip-wildcard\s+([\d\.\*]+)`),
-		}
-	} else {
-		dgEscaped := regexp.QuoteMeta(deviceGroup)
-		deviceGroupPatterns = []*regexp.Regexp{
-			regexp.MustCompile(fmt.Sprintf(`set\s+device-group\s+%s\s+address\s+(\S+)\s+ip-netmask\s+([\d\./]+)`, dgEscaped)),
-			regexp.MustCompile(fmt.Sprintf(`set\s+device-group\s+%s\s+address\s+(\S+)\s+ip-range\s+([\d\.\-\s]+)`, dgEscaped)),
-			regexp.MustCompile(fmt.Sprintf(`set\s+device-group\s+%s\s+address\s+(\S+)\s+fqdn\s+(\S+)`, dgEscaped)),
-			regexp.MustCompile(fmt.Sprintf(`set\s+device-group\s+%s\s+address\s+(\S+)\s+ip-wildcard\s+([\d\.\*]+)`, dgEscaped)),
-		}
-	}
+	patterns := scopeAddressPatterns(deviceGroup)
 
 	// Process cached lines (no file I/O needed!)
 	for _, line := range cache.AllLines {
@@ -540,11 +691,6 @@ func (p *PANLogProcessor) FindDuplicateAddressesInDeviceGroupFromCache(cache *Co
 		var found bool
 		
 		// Try all patterns for the target scope
-		patterns := deviceGroupPatterns
-		if deviceGroup == "shared" {
-			patterns = sharedPatterns
-		}
-		
 		for _, pattern := range patterns {
 			if matches := pattern.FindStringSubmatch(line); matches != nil {
 				addrName, addrValue = matches[1], matches[2]
@@ -645,31 +791,11 @@ func (p *PANLogProcessor) FindDuplicateAddressesInDeviceGroup(filePath, deviceGr
 		fileInfo.Name(),
 		utils.FormatBytes(fileInfo.Size()))
 
-	// Open and read file
-	file, err := os.Open(filePath)
-	if err != nil {
-		return fmt.Errorf("error opening file: %w", err)
-	}
-	defer file.Close()
-
 	p.println("  Reading file into memory...")
 
-	// Read all lines into memory
-	var allLines []string
-	scanner := bufio.NewScanner(file)
-
-	// Set a large buffer size for performance with big files
-	buf := make([]byte, 64*1024)
-	scanner.Buffer(buf, 1024*1024)
-
-	for scanner.Scan() {
-		line := strings.TrimSpace(scanner.Text())
-		if line != "" {
-			allLines = append(allLines, line)
-		}
-	}
-
-	if err := scanner.Err(); err != nil {
+	// Read all lines into memory with a single read of the whole file
+	allLines, err := readConfigLines(filePath)
+	if err != nil {
 		return fmt.Errorf("error reading file: %w", err)
 	}
 
@@ -683,30 +809,15 @@ func (p *PANLogProcessor) FindDuplicateAddressesInDeviceGroup(filePath, deviceGr
 	if totalLines > 5000000 {
 		progressInterval = 40000
 	}
-	lastProgress := 0
+	lastPercent := 0
 
 	// Create comprehensive patterns for all address types
-	var deviceGroupPatterns, sharedPatterns []*regexp.Regexp
-	if deviceGroup == "shared" {
-		sharedPatterns = []*regexp.Regexp{
-			regexp.MustCompile(`set\s+shared\s+address\s+(\S+)\s+ip-netmask\s+([\d\./]+)`),
-			regexp.MustCompile(`set\s+shared\s+address\s+(\S+)\s+ip-range\s+([\d\.\-\s]+)`),
-			regexp.MustCompile(`set\s+shared\s+address\s+(\S+)\s+fqdn\s+(\S+)`),
-			regexp.MustCompile(`set\s+shared\s+address\s+(\S+)\s+ip-wildcard\s+([\d\.\*]+)`),
-		}
-	} else {
-		dgEscaped := regexp.QuoteMeta(deviceGroup)
-		deviceGroupPatterns = []*regexp.Regexp{
-			regexp.MustCompile(fmt.Sprintf(`set\s+device-group\s+%s\s+address\s+(\S+)\s+ip-netmask\s+([\d\./]+)`, dgEscaped)),
-			regexp.MustCompile(fmt.Sprintf(`set\s+device-group\s+%s\s+address\s+(\S+)\s+ip-range\s+([\d\.\-\s]+)`, dgEscaped)),
-			regexp.MustCompile(fmt.Sprintf(`set\s+device-group\s+%s\s+address\s+(\S+)\s+fqdn\s+(\S+)`, dgEscaped)),
-			regexp.MustCompile(fmt.Sprintf(`set\s+device-group\s+%s\s+address\s+(\S+)\s+ip-wildcard\s+([\d\.\*]+)`, dgEscaped)),
-		}
-	}
+	patterns := scopeAddressPatterns(deviceGroup)
 
 	for lineNum, line := range allLines {
-		// Show progress
-		if lineNum > 0 && lineNum%progressInterval == 0 && lineNum != lastProgress {
+		// Show progress, only when the whole percentage has moved on
+		if lineNum%progressInterval == 0 && lineNum*100/totalLines != lastPercent {
+			lastPercent = lineNum * 100 / totalLines
 			progress := float64(lineNum) / float64(totalLines)
 			percentage := progress * 100
 			message := fmt.Sprintf("Scanning line %s/%s (%.0f%%)",
@@ -717,7 +828,6 @@ func (p *PANLogProcessor) FindDuplicateAddressesInDeviceGroup(filePath, deviceGr
 			} else {
 				p.printf("    %s\n", message)
 			}
-			lastProgress = lineNum
 		}
 
 		// Check for address definitions in the target device group or shared using all patterns
@@ -725,11 +835,6 @@ func (p *PANLogProcessor) FindDuplicateAddressesInDeviceGroup(filePath, deviceGr
 		var found bool
 		
 		// Try all patterns for the target scope
-		patterns := deviceGroupPatterns
-		if deviceGroup == "shared" {
-			patterns = sharedPatterns
-		}
-		
 		for _, pattern := range patterns {
 			if matches := pattern.FindStringSubmatch(line); matches != nil {
 				addrName, addrValue = matches[1], matches[2]
@@ -793,52 +898,42 @@ func (p *PANLogProcessor) FindDuplicateAddressesInDeviceGroup(filePath, deviceGr
 
 // DiscoverDeviceGroups scans a config file and returns all unique device groups found
 func (p *PANLogProcessor) DiscoverDeviceGroups(filePath string) ([]string, error) {
-	// Open and read file
-	file, err := os.Open(filePath)
-	if err != nil {
-		return nil, fmt.Errorf("error opening file: %w", err)
+	// Reuse the lines of a scan of the same file, otherwise read the whole
+	// file in one call and slice it in place
+	allLines := p.loadedLines(filePath)
+	if allLines == nil {
+		var err error
+		if allLines, err = readConfigLines(filePath); err != nil {
+			return nil, fmt.Errorf("error reading file: %w", err)
+		}
 	}
-	defer file.Close()
 
 	deviceGroups := make(map[string]bool)
-	scanner := bufio.NewScanner(file)
-
-	// Set a large buffer size for performance
-	buf := make([]byte, 64*1024)
-	scanner.Buffer(buf, 1024*1024)
+	hasSharedAddresses := false
 
-	// Pattern to match device group references
-	deviceGroupPattern := regexp.MustCompile(`set\s+device-group\s+(\S+)`)
-	sharedPattern := regexp.MustCompile(`set\s+shared\s+address`)
+	for lineNum, line := range allLines {
+		lineCount := lineNum + 1
 
-	lineCount := 0
-	hasSharedAddresses := false
-	
-	for scanner.Scan() {
-		lineCount++
-		line := strings.TrimSpace(scanner.Text())
-		
 		// Show progress for large files
 		if lineCount%100000 == 0 {
 			p.printf("  Scanned %s lines for device groups...\n", utils.FormatNumber(lineCount))
 		}
 
 		// Check for device groups
-		if matches := deviceGroupPattern.FindStringSubmatch(line); matches != nil {
-			deviceGroupName := matches[1]
+		if deviceGroupName := prefixDeviceGroup(line); deviceGroupName != "" {
 			deviceGroups[deviceGroupName] = true
+		} else if strings.Contains(line, "device-group") {
+			if matches := p.Patterns.DeviceGroupSet.FindStringSubmatch(line); matches != nil {
+				deviceGroups[matches[1]] = true
+			}
 		}
 		
 		// Check for shared addresses
-		if sharedPattern.MatchString(line) {
+		if p.Patterns.SharedAddress.MatchString(line) {
 			hasSharedAddresses = true
 		}
 	}
 
-	if err := scanner.Err(); err != nil {
-		return nil, fmt.Errorf("error reading file: %w", err)
-	}
-
 	// Convert to sorted slice and add shared if found
 	var result []string
 	if hasSharedAddresses {
@@ -891,11 +986,14 @@ func (p *PANLogProcessor) writeDuplicateResults(deviceGroup string, duplicates [
 		return fmt.Errorf("failed to create outputs directory: %w", err)
 	}
 
-	file, err := os.Create(outputFile)
+	outFile, err := os.Create(outputFile)
 	if err != nil {
 		return fmt.Errorf("failed to create output file: %w", err)
 	}
-	defer file.Close()
+	defer outFile.Close()
+
+	// Buffer the per-address writes below into a few large ones
+	file := bufio.NewWriterSize(outFile, 256*1024)
 
 	// Group duplicates by IP
 	duplicatesByIP := make(map[string][]models.RedundantAddress)
@@ -920,5 +1018,8 @@ func (p *PANLogProcessor) writeDuplicateResults(deviceGroup string, duplicates [
 		fmt.Fprintln(file)
 	}
 
+	if err := file.Flush(); err != nil {
+		return fmt.Errorf("failed to write output file: %w", err)
+	}
 	return nil
 }
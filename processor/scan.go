@@ -0,0 +1,146 @@
+package processor
+
+import (
+	"strings"
+
+	"palo-pan-parsing/models"
+)
+
+// lineScan collects what the main scan finds in a range of configuration lines
+type lineScan struct {
+	results    []*models.AddressResult // indexed like the matcher's targets, nil until an address is seen
+	ipEntries  []ipDefinition
+	groupLines []addressGroupLine
+	ruleLines  []securityRuleLine
+}
+
+// ipDefinition is an ip-netmask address definition seen during the main scan
+type ipDefinition struct {
+	IPNetmask string
+	Address   models.IPAddress
+}
+
+// mainScan holds the read-only state shared by every chunk of the main scan
+type mainScan struct {
+	matcher     *stringMatcher
+	targets     []string
+	targetIndex map[string]int // target address -> matcher pattern index
+}
+
+// result returns the scan's result for the target at idx, creating it on first use
+func (s *lineScan) result(idx int) *models.AddressResult {
+	if s.results[idx] == nil {
+		s.results[idx] = NewAddressResult()
+	}
+	return s.results[idx]
+}
+
+// scanLines runs the main per-line analysis over lines and records it in scan.
+// It only reads shared processor state, so chunks can be scanned concurrently.
+func (p *PANLogProcessor) scanLines(scan *lineScan, lines []string, ms *mainScan) {
+	var matchingAddresses []int
+
+	for _, line := range lines {
+		// Fast early rejection for empty or very short lines
+		if len(line) < 10 {
+			continue
+		}
+
+		// Check for IP netmask definitions first (optimized for common case)
+		if strings.Contains(line, "ip-netmask") {
+			if matches := p.Patterns.IPNetmask.FindStringSubmatch(line); matches != nil {
+				addrName, ipNetmask := matches[2], matches[3]
+				if idx, ok := ms.targetIndex[addrName]; ok {
+					scan.result(idx).IPNetmask = ipNetmask
+				}
+				// The definition's scope comes from the same match
+				deviceGroup := "Unknown"
+				if strings.HasPrefix(line, "set shared") {
+					deviceGroup = "shared"
+				} else if matches[1] != "" {
+					deviceGroup = matches[1]
+				}
+				// Track all IP mappings for redundancy detection
+				scan.ipEntries = append(scan.ipEntries, ipDefinition{
+					IPNetmask: ipNetmask,
+					Address: models.IPAddress{
+						Name:        addrName,
+						Line:        line,
+						DeviceGroup: deviceGroup,
+					},
+				})
+			}
+		}
+
+		// Collect address-group definitions for the indirect and nested phases
+		if strings.Contains(line, "address-group") {
+			if agInfo := p.extractAddressGroup(line); agInfo != nil {
+				scan.groupLines = append(scan.groupLines, addressGroupLine{Line: line, Info: *agInfo})
+			}
+		}
+
+		// Security rule lines are collected for the indirect rule phase ("rule"
+		// covers both "security-rule" and "security rules")
+		isRuleLine := strings.Contains(line, "security") && strings.Contains(line, "rule")
+
+		// Find every target address in the line with a single automaton scan
+		matchingAddresses = ms.matcher.findAll(line, matchingAddresses[:0])
+		if len(matchingAddresses) == 0 {
+			if isRuleLine {
+				scan.ruleLines = append(scan.ruleLines, securityRuleLine{Line: line})
+			}
+			continue
+		}
+
+		// Resolve the device group once for every address on this line
+		deviceGroup := p.lineDeviceGroup(line)
+		if isRuleLine {
+			scan.ruleLines = append(scan.ruleLines, securityRuleLine{Line: line, DeviceGroup: deviceGroup, Resolved: true})
+		}
+
+		// Process line for each matching address
+		for _, idx := range matchingAddresses {
+			result := scan.result(idx)
+			result.MatchingLines = append(result.MatchingLines, line)
+			p.extractItemsFromLine(result, line, ms.targets[idx], deviceGroup)
+		}
+	}
+}
+
+// merge appends a scan of the lines that follow s, giving the same result as
+// scanning both ranges in one go
+func (s *lineScan) merge(next *lineScan) {
+	s.ipEntries = append(s.ipEntries, next.ipEntries...)
+	s.groupLines = append(s.groupLines, next.groupLines...)
+	s.ruleLines = append(s.ruleLines, next.ruleLines...)
+
+	for idx, src := range next.results {
+		if src == nil {
+			continue
+		}
+		dst := s.result(idx)
+		dst.MatchingLines = append(dst.MatchingLines, src.MatchingLines...)
+		for dg := range src.DeviceGroups {
+			dst.DeviceGroups[dg] = true
+		}
+		// Later lines win for rules, as they do within a single scan
+		for rule, ref := range src.DirectRules {
+			dst.DirectRules[rule] = ref
+		}
+		for _, group := range src.AddressGroups {
+			if groupKey := addressGroupKey(group); !dst.AddressGroupKeys[groupKey] {
+				dst.AddressGroups = append(dst.AddressGroups, group)
+				dst.AddressGroupKeys[groupKey] = true
+			}
+		}
+		for rule := range src.NATRules {
+			dst.NATRules[rule] = true
+		}
+		for group := range src.ServiceGroups {
+			dst.ServiceGroups[group] = true
+		}
+		if src.IPNetmask != "" {
+			dst.IPNetmask = src.IPNetmask
+		}
+	}
+}
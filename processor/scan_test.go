@@ -0,0 +1,119 @@
+package processor
+
+import (
+	"fmt"
+	"os"
+	"path/filepath"
+	"reflect"
+	"runtime"
+	"strings"
+	"testing"
+)
+
+// testScanChunk is the main scan's chunk size for files under five million lines
+const testScanChunk = 20000
+
+// writeTestConfig writes a configuration of three scan chunks to a temporary
+// file. The definitions of web-1 and db-1 change from one chunk to the next, so
+// the results depend on how the chunks are merged.
+func writeTestConfig(t *testing.T) string {
+	t.Helper()
+	lines := make([]string, 0, 3*testScanChunk)
+	filler := func(upTo int) {
+		for len(lines) < upTo {
+			n := len(lines)
+			lines = append(lines, fmt.Sprintf("set device-group dg-%d address filler-%d ip-netmask 10.9.%d.%d/32", n%7, n, n/256%256, n%256))
+		}
+	}
+
+	// First chunk
+	lines = append(lines,
+		"set device-group dg-a address web-1 ip-netmask 10.0.0.1/32",
+		"set device-group dg-a address-group web-servers static [ web-1 db-1 ]",
+		"set device-group dg-a pre-rulebase security rules allow-web destination web-1",
+		"set device-group dg-a pre-rulebase nat rules nat-rule web-nat destination web-1",
+	)
+	filler(testScanChunk - 1)
+
+	// A rule redefined on both sides of the first chunk boundary
+	lines = append(lines,
+		"set device-group dg-a pre-rulebase security rules allow-db destination db-1",
+		"set device-group dg-b pre-rulebase security rules allow-db destination db-1",
+	)
+
+	// Second chunk repeats a group from the first and redefines a rule
+	lines = append(lines,
+		"set device-group dg-a address-group web-servers static [ web-1 db-1 ]",
+		"set shared address-group all-servers static [ web-1 db-1 ]",
+		"set device-group dg-b pre-rulebase security rules allow-web destination web-1",
+		"set device-group dg-b service-group web-svc members web-1",
+	)
+	filler(2 * testScanChunk)
+
+	// Third chunk redefines web-1 with the IP another address shares
+	lines = append(lines,
+		"set device-group dg-b address web-1 ip-netmask 10.0.0.2/32",
+		"set device-group dg-c address web-dup ip-netmask 10.0.0.2/32",
+		"set shared address-group all-servers static [ web-1 db-1 ]",
+		"set device-group dg-c address-group late-servers static [ web-1 ]",
+	)
+	filler(2*testScanChunk + 500)
+
+	path := filepath.Join(t.TempDir(), "config.log")
+	if err := os.WriteFile(path, []byte(strings.Join(lines, "\n")+"\n"), 0644); err != nil {
+		t.Fatal(err)
+	}
+	return path
+}
+
+// scanWithProcs runs ProcessFileSinglePass over path with GOMAXPROCS set to procs
+func scanWithProcs(t *testing.T, path string, addresses []string, procs int) *PANLogProcessor {
+	t.Helper()
+	defer runtime.GOMAXPROCS(runtime.GOMAXPROCS(procs))
+	p := NewPANLogProcessor()
+	p.Silent = true
+	if err := p.ProcessFileSinglePass(path, addresses); err != nil {
+		t.Fatal(err)
+	}
+	return p
+}
+
+func TestChunkedScanMatchesSequentialScan(t *testing.T) {
+	path := writeTestConfig(t)
+	addresses := []string{"web-1", "db-1", "missing"}
+
+	sequential := scanWithProcs(t, path, addresses, 1)
+	parallel := scanWithProcs(t, path, addresses, 4)
+	if !reflect.DeepEqual(sequential.Results, parallel.Results) {
+		t.Fatalf("parallel scan results differ from sequential scan:\nsequential: %+v\nparallel:   %+v",
+			sequential.Results, parallel.Results)
+	}
+
+	web := parallel.Results["web-1"]
+	if web.IPNetmask != "10.0.0.2/32" {
+		t.Errorf("web-1 ip-netmask = %q, want the later definition 10.0.0.2/32", web.IPNetmask)
+	}
+	if got := web.DirectRules["allow-web"].DeviceGroup; got != "dg-b" {
+		t.Errorf("allow-web device group = %q, want the later definition dg-b", got)
+	}
+	if got := parallel.Results["db-1"].DirectRules["allow-db"].DeviceGroup; got != "dg-b" {
+		t.Errorf("allow-db device group = %q, want the later definition dg-b", got)
+	}
+
+	var groups []string
+	for _, group := range web.AddressGroups {
+		groups = append(groups, group.Name)
+	}
+	if want := []string{"web-servers", "all-servers", "late-servers"}; !reflect.DeepEqual(groups, want) {
+		t.Errorf("web-1 address groups = %v, want each once in first-seen order %v", groups, want)
+	}
+	if len(web.AddressGroupKeys) != len(web.AddressGroups) {
+		t.Errorf("web-1 has %d group keys for %d groups", len(web.AddressGroupKeys), len(web.AddressGroups))
+	}
+	if !web.NATRules["web-nat"] || !web.ServiceGroups["web-svc"] {
+		t.Errorf("web-1 NAT rules %v and service groups %v are missing entries", web.NATRules, web.ServiceGroups)
+	}
+	if len(web.RedundantAddresses) == 0 {
+		t.Errorf("web-1 has no redundant addresses, want web-dup")
+	}
+}
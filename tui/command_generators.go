@@ -28,9 +28,8 @@ func (m Model) executeSelectedOperations() (Model, tea.Cmd) {
 						if addresses, ok := m.analysisResults["addresses"].([]string); ok {
 							// Generate cleanup commands for all addresses that have redundant addresses
 							for _, address := range addresses {
-								if _, exists := proc.Results[address]; exists {
-									itemsDict := proc.FormatResults(address)
-									if len(itemsDict.RedundantAddresses) > 0 {
+								if result, exists := proc.Results[address]; exists {
+									if len(result.RedundantAddresses) > 0 {
 										cmds = append(cmds, generateCleanupCmd(proc, configFile, address))
 									}
 								}
@@ -127,12 +126,11 @@ func (m Model) showComprehensiveAnalysisSummary() (Model, tea.Cmd) {
 				for _, address := range addresses {
 					if result, exists := analysisResults.Results[address]; exists {
 						totalMatches += len(result.MatchingLines)
-					}
 
-					// Check for additional analysis results
-					itemsDict := analysisResults.FormatResults(address)
-					addressGroupCount += len(itemsDict.AddressGroups)
-					redundantAddressCount += len(itemsDict.RedundantAddresses)
+						// Check for additional analysis results
+						addressGroupCount += len(result.AddressGroups)
+						redundantAddressCount += len(result.RedundantAddresses)
+					}
 
 					// Add result file
 					resultFile := fmt.Sprintf("%s_results.yml", address)
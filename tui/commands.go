@@ -5,6 +5,7 @@ import (
 	"strings"
 	"sync"
 
+	"palo-pan-parsing/models"
 	"palo-pan-parsing/processor"
 	"palo-pan-parsing/utils"
 
@@ -126,15 +127,37 @@ func processFileCmd(logFile string, addresses []string) tea.Cmd {
 			var addressesWithGroups []string
 			var filesGenerated []string
 
-			// Generate results for each address
-			for _, address := range addresses {
+			// Reports only read the finished scan results, so they are written
+			// concurrently and collected per address to keep their order
+			itemsDicts := make([]*models.FormattedResults, len(addresses))
+			writeErrs := make([]error, len(addresses))
+			writers := make(chan struct{}, min(utils.MaxReportWriters, len(addresses)))
+			var wg sync.WaitGroup
+			for i, address := range addresses {
 				result, exists := panProcessor.Results[address]
 				if !exists || len(result.MatchingLines) == 0 {
 					continue
 				}
 
-				// Format results
-				itemsDict := panProcessor.FormatResults(address)
+				wg.Add(1)
+				go func(i int, address string, result *models.AddressResult) {
+					defer wg.Done()
+					writers <- struct{}{}
+					defer func() { <-writers }()
+
+					// Format results and generate the output file
+					itemsDicts[i] = panProcessor.FormatResults(address)
+					outputFile := fmt.Sprintf("%s_results.yml", address)
+					writeErrs[i] = utils.WriteResults(outputFile, address, result, itemsDicts[i])
+				}(i, address, result)
+			}
+			wg.Wait()
+
+			for i, address := range addresses {
+				itemsDict := itemsDicts[i]
+				if itemsDict == nil {
+					continue
+				}
 
 				// Check for address groups and redundant addresses
 				if len(itemsDict.AddressGroups) > 0 {
@@ -145,17 +168,14 @@ func processFileCmd(logFile string, addresses []string) tea.Cmd {
 					hasRedundantAddrs = true
 				}
 
-				// Generate output file
-				outputFile := fmt.Sprintf("%s_results.yml", address)
-				err := utils.WriteResults(outputFile, address, result.MatchingLines, itemsDict)
-				if err != nil {
+				if err := writeErrs[i]; err != nil {
 					setProcessingComplete(ProcessResult{
 						Success: false,
 						Error:   fmt.Errorf("error writing results for %s: %w", address, err),
 					})
 					return
 				}
-				filesGenerated = append(filesGenerated, outputFile)
+				filesGenerated = append(filesGenerated, fmt.Sprintf("%s_results.yml", address))
 			}
 
 			setProcessingComplete(ProcessResult{
@@ -205,8 +225,10 @@ func (m Model) handleProcessResult(result ProcessResult) (Model, tea.Cmd) {
 			if result.OperationType == "Cleanup Commands" {
 				// Extract cleanup-specific information from summary
 				if strings.Contains(result.OperationSummary, "Target Address:") {
-					lines := strings.Split(result.OperationSummary, "\n")
-					for _, line := range lines {
+					// Walk the summary line by line without splitting it into a slice
+					for rest := result.OperationSummary; rest != ""; {
+						var line string
+						line, rest, _ = strings.Cut(rest, "\n")
 						line = strings.TrimSpace(line)
 						if strings.HasPrefix(line, "Target Address:") {
 							m.addFormattedLine(line, true)
@@ -342,8 +364,8 @@ func (m Model) handleProcessResult(result ProcessResult) (Model, tea.Cmd) {
 // generateAddressGroupCmdWithName creates a command to generate address group commands with custom name
 func generateAddressGroupCmdWithName(proc *processor.PANLogProcessor, address, newAddressName string) tea.Cmd {
 	return tea.Cmd(func() tea.Msg {
-		itemsDict := proc.FormatResults(address)
-		if len(itemsDict.AddressGroups) == 0 {
+		addressGroups := proc.AddressGroupsFor(address)
+		if len(addressGroups) == 0 {
 			return ProcessResult{
 				Success: false,
 				Error:   fmt.Errorf("no address groups found for %s", address),
@@ -354,7 +376,7 @@ func generateAddressGroupCmdWithName(proc *processor.PANLogProcessor, address, n
 
 		// Generate commands
 		var commands []string
-		for _, group := range itemsDict.AddressGroups {
+		for _, group := range addressGroups {
 			if group.Context == "shared" {
 				commands = append(commands, fmt.Sprintf("set shared address-group %s static %s", group.Name, newAddressName))
 			} else {
@@ -362,7 +384,7 @@ func generateAddressGroupCmdWithName(proc *processor.PANLogProcessor, address, n
 			}
 		}
 
-		err := utils.WriteAddressGroupCommands(outputFile, address, newAddressName, "192.168.1.100/32", commands, itemsDict.AddressGroups)
+		err := utils.WriteAddressGroupCommands(outputFile, address, newAddressName, "192.168.1.100/32", commands, addressGroups)
 		if err != nil {
 			return ProcessResult{
 				Success: false,
@@ -372,7 +394,7 @@ func generateAddressGroupCmdWithName(proc *processor.PANLogProcessor, address, n
 
 		// Create detailed summary
 		summary := fmt.Sprintf("Generated commands for %d address groups\nAddress Mapping: %s → %s",
-			len(itemsDict.AddressGroups), address, newAddressName)
+			len(addressGroups), address, newAddressName)
 
 		addressMappings := make(map[string]string)
 		addressMappings[address] = newAddressName
@@ -438,8 +460,8 @@ func generateSequentialAddressGroupCommands(proc *processor.PANLogProcessor, add
 
 		// Process each address mapping sequentially
 		for sourceAddress, newAddress := range addressMappings {
-			itemsDict := proc.FormatResults(sourceAddress)
-			if len(itemsDict.AddressGroups) == 0 {
+			addressGroups := proc.AddressGroupsFor(sourceAddress)
+			if len(addressGroups) == 0 {
 				continue // Skip addresses with no groups
 			}
 
@@ -447,7 +469,7 @@ func generateSequentialAddressGroupCommands(proc *processor.PANLogProcessor, add
 
 			// Generate commands
 			var commands []string
-			for _, group := range itemsDict.AddressGroups {
+			for _, group := range addressGroups {
 				if group.Context == "shared" {
 					commands = append(commands, fmt.Sprintf("set shared address-group %s static %s", group.Name, newAddress))
 				} else {
@@ -455,7 +477,7 @@ func generateSequentialAddressGroupCommands(proc *processor.PANLogProcessor, add
 				}
 			}
 
-			err := utils.WriteAddressGroupCommands(outputFile, sourceAddress, newAddress, "192.168.1.100/32", commands, itemsDict.AddressGroups)
+			err := utils.WriteAddressGroupCommands(outputFile, sourceAddress, newAddress, "192.168.1.100/32", commands, addressGroups)
 			if err != nil {
 				return ProcessResult{
 					Success: false,
@@ -464,7 +486,7 @@ func generateSequentialAddressGroupCommands(proc *processor.PANLogProcessor, add
 			}
 
 			filesGenerated = append(filesGenerated, outputFile)
-			totalGroups += len(itemsDict.AddressGroups)
+			totalGroups += len(addressGroups)
 			processedCount++
 		}
 
@@ -494,8 +516,8 @@ func generateSequentialAddressGroupCommands(proc *processor.PANLogProcessor, add
 // generateAddressGroupCmdWithNameAndIP generates address group commands with IP address input
 func generateAddressGroupCmdWithNameAndIP(proc *processor.PANLogProcessor, address, newAddressName, ipAddress string) tea.Cmd {
 	return tea.Cmd(func() tea.Msg {
-		itemsDict := proc.FormatResults(address)
-		if len(itemsDict.AddressGroups) == 0 {
+		addressGroups := proc.AddressGroupsFor(address)
+		if len(addressGroups) == 0 {
 			return ProcessResult{
 				Success: false,
 				Error:   fmt.Errorf("no address groups found for %s", address),
@@ -506,7 +528,7 @@ func generateAddressGroupCmdWithNameAndIP(proc *processor.PANLogProcessor, addre
 
 		// Generate commands
 		var commands []string
-		for _, group := range itemsDict.AddressGroups {
+		for _, group := range addressGroups {
 			if group.Context == "shared" {
 				commands = append(commands, fmt.Sprintf("set shared address-group %s static %s", group.Name, newAddressName))
 			} else {
@@ -514,7 +536,7 @@ func generateAddressGroupCmdWithNameAndIP(proc *processor.PANLogProcessor, addre
 			}
 		}
 
-		err := utils.WriteAddressGroupCommands(outputFile, address, newAddressName, ipAddress, commands, itemsDict.AddressGroups)
+		err := utils.WriteAddressGroupCommands(outputFile, address, newAddressName, ipAddress, commands, addressGroups)
 		if err != nil {
 			return ProcessResult{
 				Success: false,
@@ -524,7 +546,7 @@ func generateAddressGroupCmdWithNameAndIP(proc *processor.PANLogProcessor, addre
 
 		// Create detailed summary
 		summary := fmt.Sprintf("Generated commands for %d address groups\nAddress Mapping: %s → %s\nIP Address: %s",
-			len(itemsDict.AddressGroups), address, newAddressName, ipAddress)
+			len(addressGroups), address, newAddressName, ipAddress)
 
 		addressMappings := make(map[string]string)
 		addressMappings[address] = newAddressName
@@ -553,8 +575,8 @@ func generateSequentialAddressGroupCommandsWithIP(proc *processor.PANLogProcesso
 		summary.WriteString("Sequential Address Group Commands Generation:\n")
 
 		for sourceAddress, newAddress := range addressMappings {
-			itemsDict := proc.FormatResults(sourceAddress)
-			if len(itemsDict.AddressGroups) == 0 {
+			addressGroups := proc.AddressGroupsFor(sourceAddress)
+			if len(addressGroups) == 0 {
 				summary.WriteString(fmt.Sprintf("❌ %s: No address groups found\n", sourceAddress))
 				continue
 			}
@@ -563,7 +585,7 @@ func generateSequentialAddressGroupCommandsWithIP(proc *processor.PANLogProcesso
 
 			// Generate commands
 			var commands []string
-			for _, group := range itemsDict.AddressGroups {
+			for _, group := range addressGroups {
 				if group.Context == "shared" {
 					commands = append(commands, fmt.Sprintf("set shared address-group %s static %s", group.Name, newAddress))
 				} else {
@@ -571,7 +593,7 @@ func generateSequentialAddressGroupCommandsWithIP(proc *processor.PANLogProcesso
 				}
 			}
 
-			err := utils.WriteAddressGroupCommands(outputFile, sourceAddress, newAddress, ipAddress, commands, itemsDict.AddressGroups)
+			err := utils.WriteAddressGroupCommands(outputFile, sourceAddress, newAddress, ipAddress, commands, addressGroups)
 			if err != nil {
 				return ProcessResult{
 					Success: false,
@@ -580,12 +602,12 @@ func generateSequentialAddressGroupCommandsWithIP(proc *processor.PANLogProcesso
 			}
 
 			filesGenerated = append(filesGenerated, outputFile)
-			totalGroups += len(itemsDict.AddressGroups)
+			totalGroups += len(addressGroups)
 			processedCount++
 			allAddressMappings[sourceAddress] = newAddress
 
 			summary.WriteString(fmt.Sprintf("✅ %s → %s: %d groups processed\n",
-				sourceAddress, newAddress, len(itemsDict.AddressGroups)))
+				sourceAddress, newAddress, len(addressGroups)))
 		}
 
 		if processedCount == 0 {
@@ -634,8 +656,8 @@ func generateSequentialAddressGroupCommandsWithMappings(proc *processor.PANLogPr
 		summary.WriteString("Sequential Address Group Commands Generation:\n")
 
 		for sourceAddress, newAddress := range addressMappings {
-			itemsDict := proc.FormatResults(sourceAddress)
-			if len(itemsDict.AddressGroups) == 0 {
+			addressGroups := proc.AddressGroupsFor(sourceAddress)
+			if len(addressGroups) == 0 {
 				summary.WriteString(fmt.Sprintf("❌ %s: No address groups found\n", sourceAddress))
 				continue
 			}
@@ -651,7 +673,7 @@ func generateSequentialAddressGroupCommandsWithMappings(proc *processor.PANLogPr
 
 			// Generate commands
 			var commands []string
-			for _, group := range itemsDict.AddressGroups {
+			for _, group := range addressGroups {
 				if group.Context == "shared" {
 					commands = append(commands, fmt.Sprintf("set shared address-group %s static %s", group.Name, newAddress))
 				} else {
@@ -659,7 +681,7 @@ func generateSequentialAddressGroupCommandsWithMappings(proc *processor.PANLogPr
 				}
 			}
 
-			err := utils.WriteAddressGroupCommands(outputFile, sourceAddress, newAddress, ipAddress, commands, itemsDict.AddressGroups)
+			err := utils.WriteAddressGroupCommands(outputFile, sourceAddress, newAddress, ipAddress, commands, addressGroups)
 			if err != nil {
 				return ProcessResult{
 					Success: false,
@@ -668,12 +690,12 @@ func generateSequentialAddressGroupCommandsWithMappings(proc *processor.PANLogPr
 			}
 
 			filesGenerated = append(filesGenerated, outputFile)
-			totalGroups += len(itemsDict.AddressGroups)
+			totalGroups += len(addressGroups)
 			processedCount++
 			allAddressMappings[sourceAddress] = fmt.Sprintf("%s (%s)", newAddress, ipAddress)
 
 			summary.WriteString(fmt.Sprintf("✅ %s → %s (%s): %d groups processed\n",
-				sourceAddress, newAddress, ipAddress, len(itemsDict.AddressGroups)))
+				sourceAddress, newAddress, ipAddress, len(addressGroups)))
 		}
 
 		if processedCount == 0 {
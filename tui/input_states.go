@@ -157,14 +157,9 @@ func (m Model) updateAddressInput(msg tea.KeyMsg) (tea.Model, tea.Cmd) {
 		m.state = StateFileInput
 	case "enter":
 		if m.addressInput != "" {
-			// Parse comma-separated addresses
-			addresses := strings.Split(m.addressInput, ",")
-			m.addresses = make([]string, 0, len(addresses))
-			for _, addr := range addresses {
-				if trimmed := strings.TrimSpace(addr); trimmed != "" {
-					m.addresses = append(m.addresses, trimmed)
-				}
-			}
+			// Parse comma-separated addresses; processFileCmd writes one file per
+			// address concurrently, so repeats are dropped here
+			m.addresses = utils.UniqueAddresses(utils.ParseAddressList(m.addressInput))
 			if len(m.addresses) > 0 {
 				// Add to output summary
 				m.addFormattedAction("Processing Started")
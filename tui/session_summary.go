@@ -172,18 +172,15 @@ func (m *Model) addFormattedMapping(source, target string) {
 // addFormattedLine adds a formatted line by parsing key: value pairs
 func (m *Model) addFormattedLine(line string, indented bool) {
 	line = strings.TrimSpace(line)
-	if strings.Contains(line, ":") {
-		parts := strings.SplitN(line, ":", 2)
-		if len(parts) == 2 {
-			key := strings.TrimSpace(parts[0])
-			value := strings.TrimSpace(parts[1])
-			if indented {
-				m.addFormattedStatusIndented(key, value)
-			} else {
-				m.addFormattedStatus(key, value)
-			}
-			return
+	if key, value, found := strings.Cut(line, ":"); found {
+		key = strings.TrimSpace(key)
+		value = strings.TrimSpace(value)
+		if indented {
+			m.addFormattedStatusIndented(key, value)
+		} else {
+			m.addFormattedStatus(key, value)
 		}
+		return
 	}
 	// Fallback for lines that don't match key:value format
 	if indented {
@@ -3,6 +3,7 @@ package ui
 import (
 	"fmt"
 	"strings"
+	"unicode/utf8"
 )
 
 // ANSI color codes for terminal output
@@ -31,45 +32,65 @@ func ColorSecondary(text string) string { return ColorMagenta + text + ColorRese
 func ColorDimText(text string) string   { return ColorDim + ColorWhite + text + ColorReset }
 func ColorListItem(text string) string  { return ColorGreen + text + ColorReset }
 
+// Summary and section templates with their colors already applied. The count's
+// reset already ends the found line's color, so that line needs no second reset.
+const (
+	summaryFoundFormat  = ColorGreen + ColorBold + "  %s: " + ColorCyan + "%d" + ColorReset + " found\n"
+	summaryNoneFormat   = ColorDim + ColorWhite + "  %s: none found\n" + ColorReset
+	sectionHeaderFormat = ColorBlue + ColorBold + "┌%s%s┐\n" + ColorReset
+)
+
+// sectionFooter is the complete footer line, which never changes
+var sectionFooter = ColorSection("└" + strings.Repeat("─", 59) + "┘\n")
+
 // PrintBanner displays the application banner
 func PrintBanner() {
-	fmt.Println(ColorTitle("    ╔══════════════════════════════════════════════════╗"))
-	fmt.Print(ColorTitle("    ║  PAN Log Parser Tool "))
-	fmt.Print(ColorHighlight("v2.0"))
-	fmt.Println(ColorTitle("                        ║"))
-	fmt.Print(ColorTitle("    ║  "))
-	fmt.Print(ColorInfo("Advanced Palo Alto Networks Configuration       "))
-	fmt.Println(ColorTitle("║"))
-	fmt.Print(ColorTitle("    ║  "))
-	fmt.Print(ColorInfo("Analysis & Address Object Discovery Tool        "))
-	fmt.Println(ColorTitle("║"))
-	fmt.Println(ColorTitle("    ╚══════════════════════════════════════════════════╝"))
-	fmt.Println(ColorDimText("    Ready to analyze your PAN configurations with precision!"))
-	fmt.Println(ColorDimText("    Supports nested address groups, security rules & more"))
+	// Build the banner first so it reaches the terminal in a single write
+	var b strings.Builder
+	fmt.Fprintln(&b, ColorTitle("    ╔══════════════════════════════════════════════════╗"))
+	fmt.Fprint(&b, ColorTitle("    ║  PAN Log Parser Tool "))
+	fmt.Fprint(&b, ColorHighlight("v2.0"))
+	fmt.Fprintln(&b, ColorTitle("                        ║"))
+	fmt.Fprint(&b, ColorTitle("    ║  "))
+	fmt.Fprint(&b, ColorInfo("Advanced Palo Alto Networks Configuration       "))
+	fmt.Fprintln(&b, ColorTitle("║"))
+	fmt.Fprint(&b, ColorTitle("    ║  "))
+	fmt.Fprint(&b, ColorInfo("Analysis & Address Object Discovery Tool        "))
+	fmt.Fprintln(&b, ColorTitle("║"))
+	fmt.Fprintln(&b, ColorTitle("    ╚══════════════════════════════════════════════════╝"))
+	fmt.Fprintln(&b, ColorDimText("    Ready to analyze your PAN configurations with precision!"))
+	fmt.Fprintln(&b, ColorDimText("    Supports nested address groups, security rules & more"))
+	fmt.Print(b.String())
 }
 
 // PrintSectionHeader prints a formatted section header
 func PrintSectionHeader(title string) {
 	headerContent := fmt.Sprintf("─ %s", title)
-	remainingWidth := 60 - len(headerContent)
+	// Pad by runes rather than bytes so multi-byte titles line up too; 58 keeps
+	// ASCII titles as wide as when the 3-byte "─" was counted by len
+	remainingWidth := 58 - utf8.RuneCountInString(headerContent)
 	if remainingWidth < 0 {
 		remainingWidth = 0
 	}
 	dashLine := strings.Repeat("─", remainingWidth)
-	fmt.Printf(ColorSection("┌%s%s┐\n"), headerContent, dashLine)
+	fmt.Printf(sectionHeaderFormat, headerContent, dashLine)
 }
 
 // PrintSectionFooter prints a formatted section footer
 func PrintSectionFooter() {
-	dashLine := strings.Repeat("─", 59)
-	fmt.Printf(ColorSection("└%s┘\n"), dashLine)
+	fmt.Print(sectionFooter)
 }
 
 // PrintResultsSummary prints a summary of results for a category
 func PrintResultsSummary(category string, count int) {
+	fmt.Print(FormatResultsSummary(category, count))
+}
+
+// FormatResultsSummary returns the summary line PrintResultsSummary prints, so
+// callers can batch several categories into one write
+func FormatResultsSummary(category string, count int) string {
 	if count > 0 {
-		fmt.Printf(ColorSuccess("  %s: %s found\n"), category, ColorHighlight(fmt.Sprintf("%d", count)))
-	} else {
-		fmt.Printf(ColorDimText("  %s: none found\n"), category)
+		return fmt.Sprintf(summaryFoundFormat, category, count)
 	}
+	return fmt.Sprintf(summaryNoneFormat, category)
 }
@@ -119,10 +119,13 @@ func RunInteractiveMode(panProcessor *processor.PANLogProcessor, processAddress
 				fmt.Printf(ColorSuccess("\nProcessed %s out of %s addresses.\n"),
 					ColorHighlight(utils.FormatNumber(resultsCount)),
 					ColorHighlight(utils.FormatNumber(len(addresses))))
-				fmt.Println(ColorSuccess("Results written to individual files:"))
+				// Print the whole file list with a single write
+				var fileList strings.Builder
+				fileList.WriteString(ColorSuccess("Results written to individual files:") + "\n")
 				for _, outputFile := range outputFiles {
-					fmt.Printf(ColorListItem("  - %s\n"), ColorHighlight(outputFile))
+					fmt.Fprintf(&fileList, ColorListItem("  - %s\n"), ColorHighlight(outputFile))
 				}
+				fmt.Print(fileList.String())
 			}
 		}
 	} else {
@@ -247,8 +250,9 @@ func PromptRedundantAddressCleanup(targetAddress string, redundantAddresses []mo
 	fmt.Println(ColorInfo("    • Optimizing scope (promote to shared if used in multiple DGs)"))
 	fmt.Println()
 
-	// Show redundant addresses
-	fmt.Println(ColorInfo("  Redundant addresses found:"))
+	// Show redundant addresses, printing the whole list with a single write
+	var list strings.Builder
+	list.WriteString(ColorInfo("  Redundant addresses found:") + "\n")
 	for i, redundant := range redundantAddresses {
 		scope := redundant.DeviceGroup
 		if scope == "shared" {
@@ -256,10 +260,11 @@ func PromptRedundantAddressCleanup(targetAddress string, redundantAddresses []mo
 		} else {
 			scope = fmt.Sprintf("device-group %s", scope)
 		}
-		fmt.Printf(ColorListItem("    %d. %s (%s) - %s\n"),
+		fmt.Fprintf(&list, ColorListItem("    %d. %s (%s) - %s\n"),
 			i+1, redundant.Name, scope, redundant.IPNetmask)
 	}
-	fmt.Println()
+	list.WriteString("\n")
+	fmt.Print(list.String())
 
 	response := PromptInput("Generate redundant address cleanup commands? (y/n)", "n")
 	if response != "y" && response != "Y" {
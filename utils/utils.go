@@ -42,8 +42,11 @@ func FormatNumber(n int) string {
 
 // ParseAddressList parses comma-separated address input into a slice
 func ParseAddressList(addressInput string) []string {
+	// Walk the input once, trimming each entry in place instead of splitting first
 	var addresses []string
-	for _, addr := range strings.Split(addressInput, ",") {
+	for rest, more := addressInput, true; more; {
+		var addr string
+		addr, rest, more = strings.Cut(rest, ",")
 		if trimmed := strings.TrimSpace(addr); trimmed != "" {
 			addresses = append(addresses, trimmed)
 		}
@@ -51,6 +54,20 @@ func ParseAddressList(addressInput string) []string {
 	return addresses
 }
 
+// UniqueAddresses drops repeated addresses, keeping the first occurrence of each in order.
+// Each address has its own results file, so a repeat would be written twice.
+func UniqueAddresses(addresses []string) []string {
+	seen := make(map[string]bool, len(addresses))
+	unique := make([]string, 0, len(addresses))
+	for _, addr := range addresses {
+		if !seen[addr] {
+			seen[addr] = true
+			unique = append(unique, addr)
+		}
+	}
+	return unique
+}
+
 // ClearScreen clears the terminal screen
 func ClearScreen() {
 	if runtime.GOOS == "windows" {
@@ -69,21 +86,19 @@ func EnsureOutputsDir() error {
 	return nil
 }
 
-// ParseGroupMembers parses address group member list from definition string
-func ParseGroupMembers(definition string) []string {
+// ParseGroupMembers parses address group member list from definition string into a set
+func ParseGroupMembers(definition string) map[string]bool {
 	// Remove brackets and split by whitespace
 	definition = strings.TrimSpace(definition)
 	if strings.HasPrefix(definition, "[") && strings.HasSuffix(definition, "]") {
 		definition = definition[1 : len(definition)-1]
 	}
 
-	// Split and clean up members
+	// Fields already drops empty entries and surrounding whitespace
 	fields := strings.Fields(definition)
-	var members []string
+	members := make(map[string]bool, len(fields))
 	for _, field := range fields {
-		if trimmed := strings.TrimSpace(field); trimmed != "" {
-			members = append(members, trimmed)
-		}
+		members[field] = true
 	}
 	return members
 }
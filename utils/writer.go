@@ -1,16 +1,25 @@
 package utils
 
 import (
+	"bufio"
 	"fmt"
+	"io"
 	"os"
 	"sort"
+	"strconv"
 	"strings"
 
 	"palo-pan-parsing/models"
 )
 
-// WriteResults writes results to file in a structured YAML-like format
-func WriteResults(outputFile, addressName string, matchingLines []string, itemsDict *models.FormattedResults) error {
+// MaxReportWriters caps how many result files are written at once
+const MaxReportWriters = 8
+
+// WriteResults writes results to file in a structured YAML-like format. Security
+// rules are read from result directly; itemsDict supplies the other sections.
+func WriteResults(outputFile, addressName string, result *models.AddressResult, itemsDict *models.FormattedResults) error {
+	matchingLines := result.MatchingLines
+
 	// Ensure outputs directory exists
 	if err := EnsureOutputsDir(); err != nil {
 		return fmt.Errorf("error creating outputs directory: %w", err)
@@ -21,11 +30,14 @@ func WriteResults(outputFile, addressName string, matchingLines []string, itemsD
 		outputFile = "outputs/" + outputFile
 	}
 
-	file, err := os.Create(outputFile)
+	outFile, err := os.Create(outputFile)
 	if err != nil {
 		return fmt.Errorf("error creating output file: %w", err)
 	}
-	defer file.Close()
+	defer outFile.Close()
+
+	// Buffer the report so it reaches the file in a few large writes
+	file := bufio.NewWriterSize(outFile, 256*1024)
 
 	// Enhanced header with metadata
 	fmt.Fprintf(file, "# ═══════════════════════════════════════════════════════════════\n")
@@ -64,8 +76,12 @@ func WriteResults(outputFile, addressName string, matchingLines []string, itemsD
 	fmt.Fprintf(file, "Found [%d] lines containing '%s':\n", len(matchingLines), addressName)
 	fmt.Fprintf(file, "---\n")
 	if len(matchingLines) > 0 {
+		// Written piecewise rather than through Fprintf, as there can be many lines
 		for i, line := range matchingLines {
-			fmt.Fprintf(file, "%d.%s\n", i+1, line)
+			file.WriteString(strconv.Itoa(i + 1))
+			file.WriteByte('.')
+			file.WriteString(line)
+			file.WriteByte('\n')
 		}
 	} else {
 		fmt.Fprintf(file, "No matching lines found\n")
@@ -76,8 +92,9 @@ func WriteResults(outputFile, addressName string, matchingLines []string, itemsD
 
 	// Write each category
 	writeCategory(file, "Device Groups", itemsDict.DeviceGroups)
-	writeSecurityRulesCategory(file, "Direct Security Rules", itemsDict.DirectSecurityRules, matchingLines)
-	writeSecurityRulesCategory(file, "Indirect Security Rules (via Address Groups)", itemsDict.IndirectSecurityRules, matchingLines)
+	commandLines := securityRuleCommandLines(matchingLines)
+	writeSecurityRulesCategory(file, "Direct Security Rules", result.DirectRules, "direct reference", commandLines)
+	writeSecurityRulesCategory(file, "Indirect Security Rules (via Address Groups)", result.IndirectRules, "indirect reference", commandLines)
 	writeAddressGroupsCategory(file, addressName, itemsDict.AddressGroups)
 	writeCategory(file, "NAT Rules", itemsDict.NATRules)
 	writeCategory(file, "Service Groups", itemsDict.ServiceGroups)
@@ -90,10 +107,27 @@ func WriteResults(outputFile, addressName string, matchingLines []string, itemsD
 	fmt.Fprintf(file, "# Advanced Palo Alto Networks Configuration Analysis\n")
 	fmt.Fprintf(file, "# ═══════════════════════════════════════════════════════════════\n")
 
+	if err := file.Flush(); err != nil {
+		return fmt.Errorf("error writing output file: %w", err)
+	}
 	return nil
 }
 
-func writeCategory(file *os.File, category string, items []string) {
+// ruleEntrySeparator joins a rule name to its device group in formatted rule entries
+const ruleEntrySeparator = " (Device Group: "
+
+// securityRuleCommandLines returns the lines that can serve as a rule's command
+func securityRuleCommandLines(matchingLines []string) []string {
+	var commandLines []string
+	for _, line := range matchingLines {
+		if strings.Contains(line, "security") && strings.Contains(line, "rules") {
+			commandLines = append(commandLines, line)
+		}
+	}
+	return commandLines
+}
+
+func writeCategory(file io.Writer, category string, items []string) {
 	count := len(items)
 	fmt.Fprintf(file, "# %s\n", strings.ToUpper(category))
 	fmt.Fprintf(file, "Found [%d] item", count)
@@ -112,8 +146,8 @@ func writeCategory(file *os.File, category string, items []string) {
 	fmt.Fprintf(file, "---\n")
 }
 
-func writeSecurityRulesCategory(file *os.File, category string, items []string, matchingLines []string) {
-	count := len(items)
+func writeSecurityRulesCategory(file io.Writer, category string, rules map[string]models.RuleReference, defaultContext string, commandLines []string) {
+	count := len(rules)
 	fmt.Fprintf(file, "# %s\n", strings.ToUpper(category))
 	fmt.Fprintf(file, "Found [%d] item", count)
 	if count != 1 {
@@ -123,31 +157,17 @@ func writeSecurityRulesCategory(file *os.File, category string, items []string,
 	fmt.Fprintf(file, "---\n")
 
 	if count > 0 {
-		// Group rules by device group
+		// Group rules by device group straight from the result maps
 		rulesByDG := make(map[string][]models.RuleContext)
-		for _, item := range items {
-			parts := strings.Split(item, " (Device Group: ")
-			if len(parts) == 2 {
-				ruleName := parts[0]
-				dgPart := parts[1]
-
-				// Remove only the final closing parenthesis
-				dgPart = strings.TrimSuffix(dgPart, ")")
-
-				var deviceGroup, context string
-				if strings.Contains(dgPart, ", ") {
-					dgAndContext := strings.SplitN(dgPart, ", ", 2)
-					deviceGroup = dgAndContext[0]
-					context = dgAndContext[1]
-				} else {
-					deviceGroup = dgPart
-				}
-
-				rulesByDG[deviceGroup] = append(rulesByDG[deviceGroup], models.RuleContext{
-					Name:    ruleName,
-					Context: context,
-				})
+		for ruleName, ref := range rules {
+			context := ref.Context
+			if context == "" {
+				context = defaultContext
 			}
+			rulesByDG[ref.DeviceGroup] = append(rulesByDG[ref.DeviceGroup], models.RuleContext{
+				Name:    ruleName,
+				Context: context,
+			})
 		}
 
 		// Sort device groups for consistent output
@@ -161,14 +181,17 @@ func writeSecurityRulesCategory(file *os.File, category string, items []string,
 		itemCount := 1
 		for _, dg := range deviceGroups {
 			rules := rulesByDG[dg]
+			// Keep the order of the formatted "name (Device Group: ...)" entries
+			sort.Slice(rules, func(i, j int) bool {
+				return rules[i].Name+ruleEntrySeparator < rules[j].Name+ruleEntrySeparator
+			})
 			for _, rule := range rules {
 				fmt.Fprintf(file, "%d. %s (device-group - %s):\n", itemCount, rule.Name, dg)
 
 				// Find the original command line for this rule
 				var commandLine string
-				for _, line := range matchingLines {
-					if strings.Contains(line, "security") && strings.Contains(line, "rules") &&
-						strings.Contains(line, rule.Name) && strings.Contains(line, dg) {
+				for _, line := range commandLines {
+					if strings.Contains(line, rule.Name) && strings.Contains(line, dg) {
 						commandLine = line
 						break
 					}
@@ -193,7 +216,7 @@ func writeSecurityRulesCategory(file *os.File, category string, items []string,
 	fmt.Fprintf(file, "---\n")
 }
 
-func writeAddressGroupsCategory(file *os.File, addressName string, groups []models.AddressGroup) {
+func writeAddressGroupsCategory(file io.Writer, addressName string, groups []models.AddressGroup) {
 	count := len(groups)
 	fmt.Fprintf(file, "# ADDRESS GROUPS\n")
 	fmt.Fprintf(file, "Found [%d] items containing '%s':\n", count, addressName)
@@ -216,7 +239,7 @@ func writeAddressGroupsCategory(file *os.File, addressName string, groups []mode
 	fmt.Fprintf(file, "---\n")
 }
 
-func writeRedundantAddressesCategory(file *os.File, addresses []models.RedundantAddress) {
+func writeRedundantAddressesCategory(file io.Writer, addresses []models.RedundantAddress) {
 	count := len(addresses)
 	fmt.Fprintf(file, "# REDUNDANT ADDRESSES\n")
 	fmt.Fprintf(file, "Found [%d] items with identical ip/netmask:\n", count)
@@ -285,11 +308,14 @@ func WriteAddressGroupCommands(outputFile, originalAddress, newAddressName, ipAd
 		outputFile = "outputs/" + outputFile
 	}
 
-	file, err := os.Create(outputFile)
+	outFile, err := os.Create(outputFile)
 	if err != nil {
 		return fmt.Errorf("error creating commands file: %w", err)
 	}
-	defer file.Close()
+	defer outFile.Close()
+
+	// Buffer the many small writes below into a few large ones
+	file := bufio.NewWriter(outFile)
 
 	// Enhanced header with metadata
 	fmt.Fprintf(file, "# ═══════════════════════════════════════════════════════════════\n")
@@ -398,9 +424,25 @@ func WriteAddressGroupCommands(outputFile, originalAddress, newAddressName, ipAd
 	fmt.Fprintf(file, "# Advanced Palo Alto Networks Configuration Analysis\n")
 	fmt.Fprintf(file, "# ═══════════════════════════════════════════════════════════════\n")
 
+	if err := file.Flush(); err != nil {
+		return fmt.Errorf("error writing commands file: %w", err)
+	}
 	return nil
 }
 
+// cleanupSections lists the cleanup command sections in the order they are run,
+// with the title of each step
+var cleanupSections = []struct {
+	name  string
+	title string
+}{
+	{"target_creation", "CREATE TARGET ADDRESS (if needed)"},
+	{"address_groups", "UPDATE ADDRESS GROUPS"},
+	{"security_rules", "UPDATE SECURITY RULES"},
+	{"nat_rules", "UPDATE NAT RULES"},
+	{"definitions", "REMOVE REDUNDANT DEFINITIONS (do last)"},
+}
+
 // WriteCleanupCommands writes redundant address cleanup commands to file in a structured YAML-like format
 func WriteCleanupCommands(outputFile string, commands *models.CleanupCommands) error {
 	// Ensure outputs directory exists
@@ -413,11 +455,14 @@ func WriteCleanupCommands(outputFile string, commands *models.CleanupCommands) e
 		outputFile = "outputs/" + outputFile
 	}
 
-	file, err := os.Create(outputFile)
+	outFile, err := os.Create(outputFile)
 	if err != nil {
 		return fmt.Errorf("error creating cleanup commands file: %w", err)
 	}
-	defer file.Close()
+	defer outFile.Close()
+
+	// Buffer the many small writes below into a few large ones
+	file := bufio.NewWriter(outFile)
 
 	// Header in results.yml style
 	fmt.Fprintf(file, "# ═══════════════════════════════════════════════════════════════\n")
@@ -467,35 +512,15 @@ func WriteCleanupCommands(outputFile string, commands *models.CleanupCommands) e
 		commandsBySection[command.Section] = append(commandsBySection[command.Section], command)
 	}
 
-	// Define section order
-	sectionOrder := []string{"target_creation", "address_groups", "security_rules", "nat_rules", "definitions"}
-
 	// Write step descriptions at the top
 	stepNum := 1
-	for _, section := range sectionOrder {
-		sectionCommands, exists := commandsBySection[section]
-		if !exists || len(sectionCommands) == 0 {
+	for _, section := range cleanupSections {
+		sectionCommands := commandsBySection[section.name]
+		if len(sectionCommands) == 0 {
 			continue
 		}
 
-		// Get section title for steps
-		var sectionTitle string
-		switch section {
-		case "target_creation":
-			sectionTitle = fmt.Sprintf("STEP %d: CREATE TARGET ADDRESS (if needed)", stepNum)
-		case "address_groups":
-			sectionTitle = fmt.Sprintf("STEP %d: UPDATE ADDRESS GROUPS", stepNum)
-		case "security_rules":
-			sectionTitle = fmt.Sprintf("STEP %d: UPDATE SECURITY RULES", stepNum)
-		case "nat_rules":
-			sectionTitle = fmt.Sprintf("STEP %d: UPDATE NAT RULES", stepNum)
-		case "definitions":
-			sectionTitle = fmt.Sprintf("STEP %d: REMOVE REDUNDANT DEFINITIONS (do last)", stepNum)
-		default:
-			sectionTitle = fmt.Sprintf("STEP %d: %s", stepNum, strings.ToUpper(section))
-		}
-
-		fmt.Fprintf(file, "# %s\n", sectionTitle)
+		fmt.Fprintf(file, "# STEP %d: %s\n", stepNum, section.title)
 		fmt.Fprintf(file, "Found [%d] command", len(sectionCommands))
 		if len(sectionCommands) != 1 {
 			fmt.Fprintf(file, "s")
@@ -515,30 +540,13 @@ func WriteCleanupCommands(outputFile string, commands *models.CleanupCommands) e
 
 	// Write actual commands at the bottom in results.yml style
 	stepNum = 1
-	for _, section := range sectionOrder {
-		sectionCommands, exists := commandsBySection[section]
-		if !exists || len(sectionCommands) == 0 {
+	for _, section := range cleanupSections {
+		sectionCommands := commandsBySection[section.name]
+		if len(sectionCommands) == 0 {
 			continue
 		}
 
-		// Get section title for commands
-		var sectionTitle string
-		switch section {
-		case "target_creation":
-			sectionTitle = fmt.Sprintf("STEP %d COMMANDS", stepNum)
-		case "address_groups":
-			sectionTitle = fmt.Sprintf("STEP %d COMMANDS", stepNum)
-		case "security_rules":
-			sectionTitle = fmt.Sprintf("STEP %d COMMANDS", stepNum)
-		case "nat_rules":
-			sectionTitle = fmt.Sprintf("STEP %d COMMANDS", stepNum)
-		case "definitions":
-			sectionTitle = fmt.Sprintf("STEP %d COMMANDS", stepNum)
-		default:
-			sectionTitle = fmt.Sprintf("STEP %d COMMANDS", stepNum)
-		}
-
-		fmt.Fprintf(file, "# %s\n", sectionTitle)
+		fmt.Fprintf(file, "# STEP %d COMMANDS\n", stepNum)
 		fmt.Fprintf(file, "Found [%d] command", len(sectionCommands))
 		if len(sectionCommands) != 1 {
 			fmt.Fprintf(file, "s")
@@ -559,5 +567,8 @@ func WriteCleanupCommands(outputFile string, commands *models.CleanupCommands) e
 	fmt.Fprintf(file, "# Advanced Redundant Address Cleanup & Optimization\n")
 	fmt.Fprintf(file, "# ═══════════════════════════════════════════════════════════════\n")
 
+	if err := file.Flush(); err != nil {
+		return fmt.Errorf("error writing cleanup commands file: %w", err)
+	}
 	return nil
 }